@@ -9,6 +9,7 @@ LEGACY_APP_FOLDER_NAME = "ForgeBuild"
 SESSIONS_FOLDER_NAME = "sessions"
 EVIDENCE_FOLDER_NAME = "evidencia"
 LOGIN_CACHE_FILENAME = "login_cache.json"
+USERS_CACHE_FILENAME = "users_cache.json"
 DDE_EXPORT_FOLDER_NAME = "DDEs"
 DDE_EXPORT_ENV_VAR = "DDE_EXPORT_DIR"
 
@@ -61,6 +62,15 @@ def getLoginCachePath(create_parent: bool = True) -> Path:
     return path
 
 
+def getUsersCachePath(create_parent: bool = True) -> Path:
+    """Return the path for the cached list of active users shown at login."""
+
+    path = getForgeBuildRoot() / USERS_CACHE_FILENAME
+    if create_parent:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    return path
+
+
 def getDdeExportBaseDirectory(create: bool = True) -> Path:
     """Return the directory used to store exported DDE/HU documents."""
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import time
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -11,15 +12,26 @@ from app.dtos.auth_result import AuthenticationResult, AuthenticationStatus
 from app.services.auth_service import AuthService
 
 
+USERS_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+
 class AuthenticationController:
     """Handle login requests, caching and active user listings."""
 
-    def __init__(self, auth_service: AuthService, cache_path: Path) -> None:
+    def __init__(
+        self,
+        auth_service: AuthService,
+        cache_path: Path,
+        users_cache_path: Optional[Path] = None,
+    ) -> None:
         """Persist dependencies required to authenticate desktop users."""
 
         self._auth_service = auth_service
         self._cache_path = cache_path
+        self._users_cache_path = users_cache_path
         self._authenticated_user: Optional[AuthenticationResult] = None
+        self._cached_credentials: Optional[Dict[str, str]] = None
+        self._credentials_loaded = False
 
     def authenticate_user(self, username: str, password: str) -> AuthenticationResult:
         """Validate a login request and cache credentials on success."""
@@ -50,16 +62,62 @@ class AuthenticationController:
         except UserDAOError as exc:
             return [], str(exc)
 
-        return [
+        choices = [
             (
                 record.username,
                 record.displayName or record.username,
             )
             for record in records
-        ], None
+        ]
+        self._store_cached_users(choices)
+        return choices, None
+
+    def list_cached_users(self) -> List[Tuple[str, str]]:
+        """Return the users stored by the last successful listing, or an empty list when stale."""
+
+        if self._users_cache_path is None:
+            return []
+        try:
+            with self._users_cache_path.open("r", encoding="utf-8") as handle:
+                payload = json.load(handle)
+        except FileNotFoundError:
+            return []
+        except (json.JSONDecodeError, OSError):  # pragma: no cover - ruta de error
+            return []
+
+        try:
+            if time.time() - float(payload["ts"]) > USERS_CACHE_TTL_SECONDS:
+                return []
+            return [(str(username), str(display_name)) for username, display_name in payload["choices"]]
+        except (KeyError, TypeError, ValueError):
+            return []
+
+    def _store_cached_users(self, choices: List[Tuple[str, str]]) -> None:
+        """Persist the active users so the next login can show them before the database answers."""
+
+        if self._users_cache_path is None:
+            return
+
+        try:
+            self._users_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with self._users_cache_path.open("w", encoding="utf-8") as handle:
+                json.dump({"ts": time.time(), "choices": choices}, handle)
+        except OSError:  # pragma: no cover - depende del entorno
+            pass
 
     def load_cached_credentials(self) -> Optional[Dict[str, str]]:
-        """Load cached credentials if the previous login was persisted."""
+        """Load cached credentials if the previous login was persisted.
+
+        The file is read once per session; later calls reuse the loaded value.
+        """
+
+        if not self._credentials_loaded:
+            self._cached_credentials = self._read_cached_credentials()
+            self._credentials_loaded = True
+        return dict(self._cached_credentials) if self._cached_credentials else None
+
+    def _read_cached_credentials(self) -> Optional[Dict[str, str]]:
+        """Read the credentials file written by the last successful login."""
 
         try:
             with self._cache_path.open("r", encoding="utf-8") as handle:
@@ -88,3 +146,5 @@ class AuthenticationController:
                 json.dump({"username": username, "password": password}, handle)
         except OSError:  # pragma: no cover - depende del entorno
             pass
+        self._cached_credentials = {"username": username, "password": password}
+        self._credentials_loaded = True
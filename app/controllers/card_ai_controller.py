@@ -226,11 +226,12 @@ class CardAIController:
         card: CardDTO,
         output: CardAIOutputDTO,
         export_format: CardAIExportFormat,
+        serialized_json: Optional[str] = None,
     ) -> Path:
         """Persist the provided output using the structured directory layout."""
 
         try:
-            return self._export_service.export_output(card, output, export_format)
+            return self._export_service.export_output(card, output, export_format, serialized_json)
         except CardAIExportServiceError as exc:
             raise RuntimeError(str(exc)) from exc
 
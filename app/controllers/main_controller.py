@@ -8,6 +8,7 @@ from app.config.storage_paths import (
     getEvidenceDirectory,
     getLoginCachePath,
     getSessionsDirectory,
+    getUsersCachePath,
 )
 from app.controllers.auth_controller import AuthenticationController
 from app.controllers.browser_controller import BrowserController
@@ -48,6 +49,7 @@ class MainController:
     CONFLUENCE_HISTORY_CATEGORY = "desktop-confluence-history"
     CONFLUENCE_SPACES_CATEGORY = "desktop-confluence-space-history"
     LOGIN_CACHE_PATH = getLoginCachePath()
+    USERS_CACHE_PATH = getUsersCachePath()
 
     SESSIONS_DIR = getSessionsDirectory()
     EVIDENCE_DIR = getEvidenceDirectory()
@@ -69,7 +71,9 @@ class MainController:
 
         user_connector = DatabaseConnector().connection_factory()
         auth_service = AuthService(UserDAO(user_connector))
-        self.auth = AuthenticationController(auth_service, self.LOGIN_CACHE_PATH)
+        self.auth = AuthenticationController(
+            auth_service, self.LOGIN_CACHE_PATH, self.USERS_CACHE_PATH
+        )
 
         session_connector = DatabaseConnector().connection_factory()
         session_service = SessionService(
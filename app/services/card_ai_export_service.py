@@ -8,13 +8,15 @@ from enum import Enum
 from html import escape
 from importlib import resources
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterator, Optional
 
 from app.config.storage_paths import getDdeExportBaseDirectory
 from app.dtos.card_ai_dto import CardAIOutputDTO, CardDTO
 
 HTML_TEMPLATE_PACKAGE = "app.templates"
 HTML_TEMPLATE_NAME = "card_generation.html"
+EXPORT_WRITE_BUFFER_SIZE = 1 << 16
+JSON_EXPORT_ENCODER = json.JSONEncoder(ensure_ascii=False, indent=2)
 
 
 class CardAIExportServiceError(RuntimeError):
@@ -61,8 +63,13 @@ class CardAIExportService:
         card: CardDTO,
         output: CardAIOutputDTO,
         export_format: CardAIExportFormat,
+        serialized_json: Optional[str] = None,
     ) -> Path:
-        """Export the output content to disk and return the generated path."""
+        """Export the output content to disk and return the generated path.
+
+        ``serialized_json`` lets callers that already hold the indented JSON text of the
+        content skip encoding it again for JSON exports.
+        """
 
         content = output.content
         if not isinstance(content, dict):
@@ -76,7 +83,7 @@ class CardAIExportService:
 
         try:
             if export_format is CardAIExportFormat.JSON:
-                self._write_json(destination, content)
+                self._write_json(destination, content, serialized_json)
             elif export_format is CardAIExportFormat.MARKDOWN:
                 self._write_markdown(destination, content)
             elif export_format is CardAIExportFormat.DOCX:
@@ -137,32 +144,37 @@ class CardAIExportService:
         return f"{ticket}{export_format.extension}"
 
     @staticmethod
-    def _write_json(destination: Path, content: Dict[str, object]) -> None:
-        """Persist the JSON payload with indentation."""
+    def _write_json(
+        destination: Path,
+        content: Dict[str, object],
+        serialized_json: Optional[str] = None,
+    ) -> None:
+        """Persist the JSON payload with indentation, reusing pre-serialized text when given."""
 
-        with destination.open("w", encoding="utf-8") as handle:
-            json.dump(content, handle, ensure_ascii=False, indent=2)
+        with destination.open("w", encoding="utf-8", buffering=EXPORT_WRITE_BUFFER_SIZE) as handle:
+            if serialized_json is not None:
+                handle.write(serialized_json)
+            else:
+                handle.writelines(JSON_EXPORT_ENCODER.iterencode(content))
 
     @staticmethod
-    def _render_markdown(content: Dict[str, object]) -> str:
-        """Convert the JSON document into Markdown."""
+    def _iter_markdown(content: Dict[str, object]) -> Iterator[str]:
+        """Yield the Markdown representation of the JSON document chunk by chunk."""
 
-        lines = ["# Documento generado"]
+        yield "# Documento generado"
         for key, value in content.items():
-            lines.append(f"\n## {key}")
+            yield f"\n\n## {key}"
             if isinstance(value, list):
                 for item in value:
-                    lines.append(f"- {item}")
+                    yield f"\n- {item}"
             else:
-                lines.append(str(value))
-        return "\n".join(lines)
+                yield f"\n{value}"
 
     def _write_markdown(self, destination: Path, content: Dict[str, object]) -> None:
-        """Write the Markdown representation to disk."""
+        """Stream the Markdown representation to disk."""
 
-        document = self._render_markdown(content)
-        with destination.open("w", encoding="utf-8") as handle:
-            handle.write(document)
+        with destination.open("w", encoding="utf-8", buffering=EXPORT_WRITE_BUFFER_SIZE) as handle:
+            handle.writelines(self._iter_markdown(content))
 
     def _write_docx(self, destination: Path, content: Dict[str, object]) -> None:
         """Serialize the content to DOCX format."""
@@ -0,0 +1 @@
+"""Helpers shared by the desktop application that do not depend on Tk."""
@@ -0,0 +1,54 @@
+"""Ranking of text choices against a typed query, shared by the autocomplete widgets."""
+
+from __future__ import annotations
+
+import heapq
+import re
+from difflib import SequenceMatcher
+from typing import List, Sequence, Tuple
+
+
+DEFAULT_RESULT_LIMIT = 50
+MIN_FUZZY_RATIO = 0.6
+WORD_PATTERN = re.compile(r"\w+")
+
+
+def rank_choices(query: str, values: Sequence[str], limit: int = DEFAULT_RESULT_LIMIT) -> List[str]:
+    """Return up to ``limit`` values ordered by how well they match ``query``.
+
+    Prefix matches rank above substring matches. Only when nothing contains the query are
+    fuzzy matches considered: a value qualifies when one of its words reaches
+    :data:`MIN_FUZZY_RATIO` against the query, which tolerates typos without matching names
+    that merely share a letter. Ties keep the original order and an empty query returns the
+    first ``limit`` values.
+    """
+
+    needle = query.strip().casefold()
+    if not needle:
+        return list(values[:limit])
+    scored: List[Tuple[float, int, str]] = []
+    for index, value in enumerate(values):
+        position = value.casefold().find(needle)
+        if position >= 0:
+            scored.append((2.0 if position == 0 else 1.0, -index, value))
+    if not scored:
+        scored = _fuzzy_matches(needle, values)
+    return [value for _, _, value in heapq.nlargest(limit, scored)]
+
+
+def _fuzzy_matches(needle: str, values: Sequence[str]) -> List[Tuple[float, int, str]]:
+    """Score the values whose closest word is similar enough to ``needle``."""
+
+    # La consulta va como segunda secuencia, la que SequenceMatcher analiza y conserva entre palabras.
+    matcher = SequenceMatcher(None, "", needle)
+    scored: List[Tuple[float, int, str]] = []
+    for index, value in enumerate(values):
+        best = 0.0
+        for word in WORD_PATTERN.findall(value.casefold()):
+            matcher.set_seq1(word)
+            # quick_ratio es una cota superior barata; ratio solo se calcula si puede superar el umbral.
+            if matcher.quick_ratio() >= MIN_FUZZY_RATIO:
+                best = max(best, matcher.ratio())
+        if best >= MIN_FUZZY_RATIO:
+            scored.append((best, -index, value))
+    return scored
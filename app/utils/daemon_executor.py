@@ -0,0 +1,65 @@
+"""Worker pool whose threads do not keep the interpreter alive at exit."""
+
+from __future__ import annotations
+
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Callable, List, Tuple
+
+
+class DaemonExecutor:
+    """Small worker pool whose threads never keep the interpreter alive at exit.
+
+    ``ThreadPoolExecutor`` joins its workers when the interpreter shuts down, so closing the
+    app while a slow database or AI call is running would hang until that call returned.
+    Workers start lazily up to ``max_workers`` and idle ones are reused; queued futures can
+    still be cancelled before a worker picks them up, and exceptions raised by a job are
+    delivered through its future.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str) -> None:
+        """Prepare the job queue; workers are started on demand up to ``max_workers``."""
+
+        self._jobs: "queue.SimpleQueue[Tuple[Future, Callable[[], object]]]" = queue.SimpleQueue()
+        self._max_workers = max_workers
+        self._thread_name_prefix = thread_name_prefix
+        self._workers: List[threading.Thread] = []
+        self._idle = threading.Semaphore(0)
+        self._lock = threading.Lock()
+
+    def submit(self, func: Callable[[], object]) -> Future:
+        """Queue ``func`` and return the future that will hold its outcome."""
+
+        future: Future = Future()
+        self._jobs.put((future, func))
+        # Igual que ThreadPoolExecutor: un trabajador ocioso toma el trabajo sin crear otro hilo.
+        if self._idle.acquire(blocking=False):
+            return future
+        with self._lock:
+            if len(self._workers) >= self._max_workers:
+                return future
+            worker = threading.Thread(
+                target=self._work,
+                name=f"{self._thread_name_prefix}_{len(self._workers)}",
+                daemon=True,
+            )
+            self._workers.append(worker)
+        worker.start()
+        return future
+
+    def _work(self) -> None:
+        """Run queued jobs forever, skipping the ones cancelled while waiting."""
+
+        while True:
+            future, func = self._jobs.get()
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = func()
+                except BaseException as exc:  # noqa: BLE001 - se entrega al future
+                    future.set_exception(exc)
+                else:
+                    future.set_result(result)
+            # Suelta las referencias antes de quedar en espera del siguiente trabajo.
+            del future, func
+            self._idle.release()
@@ -0,0 +1,198 @@
+"""Entry with an incremental suggestion popup for long lists of choices."""
+
+from __future__ import annotations
+
+from typing import Optional, Sequence, Tuple
+
+import tkinter as tk
+from tkinter import ttk
+
+import ttkbootstrap as tb
+
+from app.utils.choice_ranking import DEFAULT_RESULT_LIMIT, rank_choices
+
+
+DEFAULT_FILTER_DELAY_MS = 120
+POPUP_MAX_ROWS = 8
+NAVIGATION_KEYSYMS = frozenset(("Up", "Down", "Return", "KP_Enter", "Escape", "Tab"))
+
+
+class AutoCompleteEntry:
+    """Entry that suggests matching values in a popup list instead of a full combobox.
+
+    Only the best :data:`DEFAULT_RESULT_LIMIT` matches are inserted in the popup, so opening
+    it costs the same regardless of how many values were provided.
+    """
+
+    def __init__(
+        self,
+        master: tk.Misc,
+        textvariable: tk.StringVar,
+        values: Sequence[str] = (),
+        limit: int = DEFAULT_RESULT_LIMIT,
+        delay_ms: int = DEFAULT_FILTER_DELAY_MS,
+    ) -> None:
+        """Create the entry and wire the keyboard handling of the popup."""
+
+        self.entry = tb.Entry(master, textvariable=textvariable)
+        self._var = textvariable
+        self._values: Tuple[str, ...] = tuple(values)
+        self._limit = limit
+        self._delay_ms = delay_ms
+        self._filter_job: Optional[str] = None
+        self._popup: Optional[tk.Toplevel] = None
+        self._listbox: Optional[tk.Listbox] = None
+        self.entry.bind("<KeyRelease>", self._on_key_release, add="+")
+        self.entry.bind("<Down>", self._on_down, add="+")
+        self.entry.bind("<Up>", self._on_up, add="+")
+        self.entry.bind("<Return>", self._on_return, add="+")
+        self.entry.bind("<KP_Enter>", self._on_return, add="+")
+        self.entry.bind("<Escape>", self._on_escape, add="+")
+        self.entry.bind("<FocusOut>", lambda _event: self.entry.after(150, self._close_if_unfocused), add="+")
+        self.entry.bind("<Destroy>", lambda _event: self.close(), add="+")
+
+    def set_values(self, values: Sequence[str]) -> None:
+        """Replace the values offered as suggestions."""
+
+        self._values = tuple(values)
+        if self._popup is not None:
+            self._show_matches()
+
+    def close(self) -> None:
+        """Hide the suggestion popup and drop any pending filter."""
+
+        if self._filter_job is not None:
+            try:
+                self.entry.after_cancel(self._filter_job)
+            except tk.TclError:
+                pass
+            self._filter_job = None
+        if self._popup is not None:
+            try:
+                self._popup.destroy()
+            except tk.TclError:
+                pass
+        self._popup = None
+        self._listbox = None
+
+    def _on_key_release(self, event: tk.Event) -> None:
+        """Refilter the suggestions once typing pauses."""
+
+        if event.keysym in NAVIGATION_KEYSYMS:
+            return
+        if self._filter_job is not None:
+            self.entry.after_cancel(self._filter_job)
+        self._filter_job = self.entry.after(self._delay_ms, self._show_matches)
+
+    def _show_matches(self) -> None:
+        """Rank the values against the typed text and show the best ones."""
+
+        self._filter_job = None
+        if not self.entry.winfo_exists():
+            return
+        matches = rank_choices(self._var.get(), self._values, self._limit)
+        if not matches or matches == [self._var.get()]:
+            self.close()
+            return
+        listbox = self._ensure_popup()
+        listbox.delete(0, tk.END)
+        listbox.insert(tk.END, *matches)
+        listbox.configure(height=min(POPUP_MAX_ROWS, len(matches)))
+        listbox.selection_set(0)
+        self._place_popup()
+
+    def _ensure_popup(self) -> tk.Listbox:
+        """Create the popup window on first use and return its listbox."""
+
+        if self._popup is not None and self._listbox is not None:
+            return self._listbox
+        popup = tk.Toplevel(self.entry)
+        popup.overrideredirect(True)
+        popup.attributes("-topmost", True)
+        listbox = tk.Listbox(popup, exportselection=False, activestyle="none")
+        scrollbar = ttk.Scrollbar(popup, orient=tk.VERTICAL, command=listbox.yview)
+        listbox.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        listbox.bind("<ButtonRelease-1>", lambda _event: self._accept(), add="+")
+        self._popup = popup
+        self._listbox = listbox
+        return listbox
+
+    def _place_popup(self) -> None:
+        """Position the popup right below the entry with the same width."""
+
+        if self._popup is None:
+            return
+        # Resuelve la geometría pendiente para leer la altura real y no la de un popup recién creado.
+        self._popup.update_idletasks()
+        x = self.entry.winfo_rootx()
+        y = self.entry.winfo_rooty() + self.entry.winfo_height()
+        self._popup.geometry(f"{self.entry.winfo_width()}x{self._popup.winfo_reqheight()}+{x}+{y}")
+
+    def _move_selection(self, step: int) -> None:
+        """Move the highlighted suggestion by ``step`` rows."""
+
+        if self._listbox is None:
+            return
+        size = self._listbox.size()
+        if not size:
+            return
+        current = self._listbox.curselection()
+        index = max(0, min(size - 1, (current[0] if current else -1) + step))
+        self._listbox.selection_clear(0, tk.END)
+        self._listbox.selection_set(index)
+        self._listbox.see(index)
+
+    def _on_down(self, _event: tk.Event) -> str:
+        """Open the suggestions or move down in them."""
+
+        if self._popup is None:
+            self._show_matches()
+        else:
+            self._move_selection(1)
+        return "break"
+
+    def _on_up(self, _event: tk.Event) -> Optional[str]:
+        """Move up in the open suggestions."""
+
+        if self._popup is None:
+            return None
+        self._move_selection(-1)
+        return "break"
+
+    def _on_return(self, _event: tk.Event) -> Optional[str]:
+        """Accept the highlighted suggestion instead of submitting while the popup is open."""
+
+        if self._popup is None:
+            return None
+        self._accept()
+        return "break"
+
+    def _on_escape(self, _event: tk.Event) -> Optional[str]:
+        """Close the open suggestions without leaving the dialog."""
+
+        if self._popup is None:
+            return None
+        self.close()
+        return "break"
+
+    def _accept(self) -> None:
+        """Copy the highlighted suggestion into the entry and close the popup."""
+
+        if self._listbox is not None:
+            selection = self._listbox.curselection()
+            if selection:
+                self._var.set(self._listbox.get(selection[0]))
+                self.entry.icursor(tk.END)
+        self.close()
+        self.entry.focus_set()
+
+    def _close_if_unfocused(self) -> None:
+        """Close the popup when the focus left both the entry and the suggestions."""
+
+        if self._popup is None or not self.entry.winfo_exists():
+            return
+        focused = self.entry.focus_get()
+        if focused is not self.entry and focused is not self._listbox:
+            self.close()
@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 import json
-import re
 import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future
 from datetime import datetime
-from typing import Callable, Dict, List, Optional
+from functools import lru_cache
+from operator import attrgetter
+from typing import Callable, Deque, Dict, List, Optional, Set, Tuple
 import tkinter as tk
 from tkinter import messagebox, ttk
 
@@ -17,36 +21,353 @@ from ttkbootstrap.widgets import DateEntry
 from app.controllers.card_ai_controller import CardAIController
 from app.dtos.card_ai_dto import CardAIGenerationResultDTO, CardAIHistoryEntryDTO, CardDTO
 from app.services.card_ai_export_service import CardAIExportFormat
+from app.utils.daemon_executor import DaemonExecutor
 
 
 TYPE_CHOICES = ("INCIDENCIA", "MEJORA", "HU")
+DATE_FILTER_KEYS = ("fechaInicio", "fechaFin")
+BEST_FILTER_CHOICES = ("Todas", "Con mejor respuesta", "Sin mejor respuesta")
+DDE_FILTER_CHOICES = ("Todas", "Con DDE generada", "Sin DDE generada")
+COMPLETENESS_FIELDS = ("descripcion", "analisis", "recomendaciones", "cosas_prevenir", "info_adicional")
+CAPTURE_TEXT_FIELDS = (
+    ("descripcion", "Descripción", "descripcion", 5),
+    ("analisis", "Análisis", "analisis", 5),
+    ("recomendaciones", "Recomendaciones", "recomendaciones", 5),
+    ("cosas_prevenir", "Cosas a prevenir", "cosasPrevenir", 5),
+    ("info_adicional", "Información adicional", "infoAdicional", 4),
+)
+COMPLETENESS_FIELD_BITS = {key: 1 << index for index, key in enumerate(COMPLETENESS_FIELDS)}
+COMPLETENESS_BY_MASK = tuple(
+    round(100 * bin(mask).count("1") / len(COMPLETENESS_FIELDS)) for mask in range(1 << len(COMPLETENESS_FIELDS))
+)
+CARDS_CACHE_TTL_SECONDS = 5.0
+CARDS_CACHE_MAX_ENTRIES = 16
+HISTORY_CACHE_TTL_SECONDS = 30.0
+HISTORY_CACHE_MAX_ENTRIES = 32
+SEARCH_IGNORED_KEYSYMS = frozenset(
+    (
+        "Shift_L", "Shift_R", "Control_L", "Control_R", "Alt_L", "Alt_R", "Meta_L", "Meta_R",
+        "Super_L", "Super_R", "Caps_Lock", "Num_Lock", "Escape", "Tab", "Left", "Right",
+        "Up", "Down", "Home", "End", "Prior", "Next", "Insert",
+    )
+)
+CardRow = Tuple[str, Tuple[str, ...], Tuple[str, ...]]
+EXECUTOR_MAX_WORKERS = 4
+_PENDING_EXPORTS: Set[Tuple[int, CardAIExportFormat]] = set()
+TEXT_INSERT_CHUNK_SIZE = 1 << 13
+_TEXT_STREAMS: Dict[str, str] = {}
+_UI_PENDING: Deque[Tuple[tk.Misc, Callable[[], None]]] = deque()
+_UI_LOCK = threading.Lock()
+_UI_DRAIN_SCHEDULED = False
+_HISTORY_CACHE: "OrderedDict[int, Tuple[float, List[CardAIHistoryEntryDTO], List[CardRow]]]" = OrderedDict()
+
+
+_EXECUTOR = DaemonExecutor(EXECUTOR_MAX_WORKERS, "cards-ai")
+
+
+def _post_to_ui(widget: tk.Misc, callback: Callable[[], None]) -> None:
+    """Queue ``callback`` for the Tk thread, waking it once for a whole burst of results.
+
+    The wakeup is scheduled on the application root rather than on ``widget``, which may be a
+    short-lived window destroyed before the drain runs.
+    """
+
+    root = widget._root()
+    with _UI_LOCK:
+        _UI_PENDING.append((root, callback))
+    _schedule_ui_drain(root)
+
+
+def _schedule_ui_drain(root: tk.Misc) -> None:
+    """Schedule one drain of the UI queue on ``root`` unless one is already pending."""
+
+    global _UI_DRAIN_SCHEDULED
+    with _UI_LOCK:
+        if _UI_DRAIN_SCHEDULED or not _UI_PENDING:
+            return
+        _UI_DRAIN_SCHEDULED = True
+    try:
+        root.after(0, _drain_ui_queue)
+    except (tk.TclError, RuntimeError):
+        with _UI_LOCK:
+            _UI_DRAIN_SCHEDULED = False
+
+
+def _drain_ui_queue() -> None:
+    """Run every callback queued by the workers since the last wakeup.
+
+    The pending callbacks are taken in a single locked swap. If one raises, the rest are put
+    back at the front of the queue and another drain is scheduled before the error propagates
+    to Tk's callback reporting.
+    """
+
+    global _UI_DRAIN_SCHEDULED
+    with _UI_LOCK:
+        pending = list(_UI_PENDING)
+        _UI_PENDING.clear()
+        _UI_DRAIN_SCHEDULED = False
+    for position, (root, callback) in enumerate(pending):
+        try:
+            callback()
+        except BaseException:
+            rest = pending[position + 1 :]
+            if rest:
+                with _UI_LOCK:
+                    _UI_PENDING.extendleft(reversed(rest))
+                _schedule_ui_drain(root)
+            raise
+
+
+def _submit_to_ui(
+    widget: tk.Misc,
+    func: Callable[[], object],
+    callback: Callable[[Future], None],
+) -> Future:
+    """Run ``func`` in the shared executor and hand its future to ``callback`` on the Tk thread."""
+
+    future = _EXECUTOR.submit(func)
+    future.add_done_callback(lambda done: _post_to_ui(widget, lambda: callback(done)))
+    return future
+
+
+_CARD_FIELDS = attrgetter(
+    "cardId",
+    "ticketId",
+    "title",
+    "incidentTypeName",
+    "status",
+    "companyName",
+    "updatedAt",
+    "createdAt",
+    "hasBestSelection",
+    "hasDdeGenerated",
+)
+_OUTPUT_FIELDS = attrgetter("outputId", "createdAt", "llmModel", "isBest", "ddeGenerated")
+
+
+def _card_row(card: CardDTO) -> CardRow:
+    """Return the ``(iid, values, tags)`` triple used to render a card in the grid."""
+
+    (
+        card_id,
+        ticket_id,
+        title,
+        incident_type,
+        status,
+        company,
+        updated_at,
+        created_at,
+        has_best,
+        has_dde,
+    ) = _CARD_FIELDS(card)
+    item_id = str(card_id)
+    tags: Tuple[str, ...] = ()
+    if has_best:
+        tags += ("best",)
+    if has_dde:
+        tags += ("dde",)
+    values = (
+        ticket_id or item_id,
+        title,
+        incident_type or "",
+        status,
+        company or "",
+        _format_datetime(updated_at or created_at),
+        "Si" if has_best else "No",
+        "Si" if has_dde else "No",
+    )
+    return item_id, values, tags
+
+
+def _history_row(entry: CardAIHistoryEntryDTO) -> CardRow:
+    """Return the ``(iid, values, tags)`` triple used to render a history entry."""
+
+    output_id, created_at, llm_model, is_best, dde_generated = _OUTPUT_FIELDS(entry.output)
+    completeness = entry.input.completenessPct if entry.input else 0
+    tags: Tuple[str, ...] = ()
+    if is_best:
+        tags += ("best",)
+    if dde_generated:
+        tags += ("dde",)
+    values = (
+        _format_datetime(created_at),
+        llm_model or "",
+        f"{completeness}%",
+        "Sí" if is_best else "No",
+        "Sí" if dde_generated else "No",
+    )
+    return str(output_id), values, tags
+
+
+def _cached_history(card_id: int) -> Optional[Tuple[List[CardAIHistoryEntryDTO], List[CardRow]]]:
+    """Return the history recently loaded for ``card_id`` or ``None`` when missing or expired."""
+
+    cached = _HISTORY_CACHE.get(card_id)
+    if cached is None:
+        return None
+    if time.monotonic() - cached[0] >= HISTORY_CACHE_TTL_SECONDS:
+        del _HISTORY_CACHE[card_id]
+        return None
+    _HISTORY_CACHE.move_to_end(card_id)
+    return cached[1], cached[2]
+
+
+def _store_history(card_id: int, entries: List[CardAIHistoryEntryDTO], rows: List[CardRow]) -> None:
+    """Remember the history of ``card_id`` evicting the least recently used card."""
+
+    _HISTORY_CACHE[card_id] = (time.monotonic(), list(entries), rows)
+    _HISTORY_CACHE.move_to_end(card_id)
+    if len(_HISTORY_CACHE) > HISTORY_CACHE_MAX_ENTRIES:
+        _HISTORY_CACHE.popitem(last=False)
+
+
+def _sync_tree_rows(
+    tree: ttk.Treeview,
+    rows: List[CardRow],
+    rendered_rows: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]],
+    rendered_order: List[str],
+) -> None:
+    """Make ``tree`` show ``rows`` deleting, inserting, updating or moving only what changed.
+
+    ``rendered_rows`` and ``rendered_order`` mirror the grid content and are kept in sync.
+    """
+
+    new_ids = {item_id for item_id, _, _ in rows}
+    stale_ids = [item_id for item_id in rendered_order if item_id not in new_ids]
+    if stale_ids:
+        tree.delete(*stale_ids)
+        for item_id in stale_ids:
+            del rendered_rows[item_id]
+        rendered_order[:] = [item_id for item_id in rendered_order if item_id in new_ids]
+    for index, (item_id, values, tags) in enumerate(rows):
+        previous = rendered_rows.get(item_id)
+        if previous is None:
+            tree.insert("", index, iid=item_id, values=values, tags=tags)
+            rendered_order.insert(index, item_id)
+        else:
+            if previous != (values, tags):
+                tree.item(item_id, values=values, tags=tags)
+            if rendered_order[index] != item_id:
+                tree.move(item_id, "", index)
+                rendered_order.remove(item_id)
+                rendered_order.insert(index, item_id)
+        rendered_rows[item_id] = (values, tags)
+
+
+@lru_cache(maxsize=4096)
+def _format_timestamp(value: datetime) -> str:
+    """Return the cached ``strftime`` representation shown in the grids."""
+
+    return value.strftime("%Y-%m-%d %H:%M")
+
 
 def _format_datetime(value: Optional[datetime]) -> str:
     """Return a friendly formatted datetime string."""
 
     if not value:
         return ""
-    return value.strftime("%Y-%m-%d %H:%M")
+    return _format_timestamp(value)
+
+
+@lru_cache(maxsize=64)
+def _parse_filter_date(value: str) -> Optional[datetime]:
+    """Return the date typed in a filter field or ``None`` when empty or invalid."""
+
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value + " 00:00", "%Y-%m-%d %H:%M")
+    except ValueError:
+        return None
+
+
+def _completeness_from_mask(mask: int) -> int:
+    """Return the completeness percentage for a bitmask of filled fields from the precomputed table."""
+
+    return COMPLETENESS_BY_MASK[mask]
 
 
 def _calculate_completeness(fields: Dict[str, str]) -> int:
     """Compute the completeness percentage mirroring the service logic."""
 
-    keys = ["descripcion", "analisis", "recomendaciones", "cosas_prevenir", "info_adicional"]
-    values = [fields.get(key, "").strip() for key in keys]
-    filled = sum(1 for value in values if value)
-    return round(100 * filled / len(values)) if values else 0
+    mask = 0
+    for key, bit in COMPLETENESS_FIELD_BITS.items():
+        if fields.get(key, "").strip():
+            mask |= bit
+    return _completeness_from_mask(mask)
+
+
+def _pretty_json(content: object) -> str:
+    """Return the indented JSON representation displayed in the result editors."""
+
+    return json.dumps(content, ensure_ascii=False, indent=2)
+
+
+def _text_content(widget: tk.Text) -> str:
+    """Return the stripped text of the widget, skipping the strip copy for blank content."""
+
+    value = widget.get("1.0", "end-1c")
+    if not value or value.isspace():
+        return ""
+    return value.strip()
+
+
+def _cancel_text_stream(widget: tk.Text) -> None:
+    """Stop a pending chunked insert started by :func:`_show_text` on ``widget``."""
+
+    job = _TEXT_STREAMS.pop(str(widget), None)
+    if job is not None:
+        widget.after_cancel(job)
+
+
+def _text_streaming(widget: tk.Text) -> bool:
+    """Return whether ``widget`` is still receiving a chunked insert."""
+
+    return str(widget) in _TEXT_STREAMS
+
+
+def _show_text(widget: tk.Text, content: str) -> None:
+    """Replace the widget content, inserting large texts in slices between Tk events."""
+
+    _cancel_text_stream(widget)
+    widget.delete("1.0", "end")
+    key = str(widget)
+
+    def _step(offset: int) -> None:
+        _TEXT_STREAMS.pop(key, None)
+        if not widget.winfo_exists():
+            return
+        end = offset + TEXT_INSERT_CHUNK_SIZE
+        widget.insert("end", content[offset:end])
+        if end < len(content):
+            _TEXT_STREAMS[key] = widget.after(1, _step, end)
+        else:
+            widget.edit_modified(False)
+
+    _step(0)
 
 
-def _progress_style(progress: tb.Progressbar, percentage: int) -> None:
-    """Adjust the progress bar style according to the completion percentage."""
+def _has_text(widget: tk.Text) -> bool:
+    """Return whether the text widget holds any non-whitespace character without copying its content."""
+
+    return bool(widget.search(r"\S", "1.0", "end-1c", regexp=True))
+
+
+def _progress_style(progress: tb.Progressbar, percentage: int, current_style: str = "") -> str:
+    """Adjust the progress bar style to the completion band and return the applied style.
+
+    The widget is only reconfigured when the band differs from ``current_style``.
+    """
 
     if percentage < 34:
-        progress.configure(bootstyle="danger")
+        style = "danger"
     elif percentage < 67:
-        progress.configure(bootstyle="warning")
+        style = "warning"
     else:
-        progress.configure(bootstyle="success")
+        style = "success"
+    if style != current_style:
+        progress.configure(bootstyle=style)
+    return style
 
 
 def _export_output(
@@ -55,27 +376,38 @@ def _export_output(
     output: CardAIGenerationResultDTO | CardAIHistoryEntryDTO,
     export_format: CardAIExportFormat,
     parent: tk.Misc,
+    serialized_json: Optional[str] = None,
 ) -> None:
-    """Delegate the export operation to the controller and notify the user."""
+    """Run the export in the background and notify the user when it finishes."""
 
     output_dto = output.output
-
-    try:
-        path = controller.export_output(card, output_dto, export_format)
-    except RuntimeError as exc:
-        messagebox.showerror("Error", str(exc))
+    export_key = (output_dto.outputId, export_format)
+    if export_key in _PENDING_EXPORTS:
         return
-    messagebox.showinfo("Exportado", f"Archivo guardado en:\n{path}")
+    _PENDING_EXPORTS.add(export_key)
+
+    def _notify(future: Future) -> None:
+        """Report the export outcome from the Tk thread."""
+
+        _PENDING_EXPORTS.discard(export_key)
+        try:
+            path = future.result()
+        except RuntimeError as exc:
+            messagebox.showerror("Error", str(exc), parent=parent)
+            return
+        messagebox.showinfo("Exportado", f"Archivo guardado en:\n{path}", parent=parent)
+
+    _submit_to_ui(
+        parent,
+        lambda: controller.export_output(card, output_dto, export_format, serialized_json),
+        _notify,
+    )
 
 
 def _show_history(parent: tk.Misc, controller: CardAIController, card: CardDTO) -> None:
     """Display a modal window with the generation history for a card."""
 
-    try:
-        history_entries = controller.list_history(card.cardId)
-    except RuntimeError as exc:
-        messagebox.showerror("Error", str(exc))
-        return
+    history_entries: List[CardAIHistoryEntryDTO] = []
 
     win = tb.Toplevel(parent)
     win.title("Historial de generación")
@@ -108,8 +440,14 @@ def _show_history(parent: tk.Misc, controller: CardAIController, card: CardDTO)
 
     detail = tk.Text(win, height=10, wrap="word")
     detail.pack(fill=BOTH, expand=YES, padx=12, pady=(0, 12))
+    detail.insert("1.0", "Cargando historial...")
+    detail.configure(state="disabled")
 
     entries_map: Dict[str, CardAIHistoryEntryDTO] = {}
+    rendered_rows: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {}
+    rendered_order: List[str] = []
+    pretty_cache: Dict[str, str] = {}
+    detail_future: Optional[Future] = None
     managed_buttons: List[tk.Widget] = []
     best_toggle_button: Optional[tk.Button] = None
 
@@ -129,10 +467,14 @@ def _show_history(parent: tk.Misc, controller: CardAIController, card: CardDTO)
             return None
         return entries_map.get(key)
 
-    def set_buttons_state() -> None:
-        """Enable or disable the history actions according to the selection."""
+    def set_buttons_state(entry: Optional[CardAIHistoryEntryDTO] = None, resolved: bool = False) -> None:
+        """Enable or disable the history actions according to the selection.
 
-        entry = get_selected_entry()
+        ``resolved`` tells that ``entry`` already reflects the selection, saving the Tk lookup.
+        """
+
+        if not resolved:
+            entry = get_selected_entry()
         state = tk.NORMAL if entry else tk.DISABLED
         for button in managed_buttons:
             if button.winfo_exists():
@@ -162,24 +504,49 @@ def _show_history(parent: tk.Misc, controller: CardAIController, card: CardDTO)
     def on_select(event: tk.Event | None) -> None:
         """Render the JSON content for the selected history entry."""
 
-        entry = get_selected_entry()
+        nonlocal detail_future
+        key = get_selected_key()
+        entry = entries_map.get(key) if key else None
+        if detail_future is not None:
+            detail_future.cancel()
+            detail_future = None
         detail.configure(state="normal")
+        _cancel_text_stream(detail)
         detail.delete("1.0", "end")
         if not entry:
             detail.configure(state="disabled")
             if mark_dde_button.winfo_exists():
                 mark_dde_button.configure(text="Marcar DDE generada", bootstyle=INFO)
-            set_buttons_state()
+            set_buttons_state(None, resolved=True)
             return
-        pretty = json.dumps(entry.output.content, ensure_ascii=False, indent=2)
-        detail.insert("1.0", pretty)
-        detail.configure(state="normal")
         detail.edit_modified(False)
         if entry.output.ddeGenerated:
             mark_dde_button.configure(text="Quitar marca DDE", bootstyle=WARNING)
         else:
             mark_dde_button.configure(text="Marcar DDE generada", bootstyle=INFO)
-        set_buttons_state()
+        set_buttons_state(entry, resolved=True)
+        cached = pretty_cache.get(key)
+        if cached is not None:
+            _show_text(detail, cached)
+            return
+        detail_future = _submit_to_ui(
+            win,
+            lambda: _pretty_json(entry.output.content),
+            lambda done: apply_detail(key, done),
+        )
+
+    def apply_detail(key: Optional[str], future: Future) -> None:
+        """Cache the formatted JSON and show it if its row is still the selected one."""
+
+        if future.cancelled():
+            return
+        pretty = future.result()
+        if key and key in entries_map:
+            pretty_cache[key] = pretty
+        if not detail.winfo_exists() or get_selected_key() != key:
+            return
+        detail.configure(state="normal")
+        _show_text(detail, pretty)
 
     def export_selected_json() -> None:
         """Export the selected history entry using the JSON helper."""
@@ -188,7 +555,14 @@ def _show_history(parent: tk.Misc, controller: CardAIController, card: CardDTO)
         if not entry:
             messagebox.showinfo("Historial", "Selecciona un resultado para exportar.")
             return
-        _export_output(controller, card, entry, CardAIExportFormat.JSON, win)
+        _export_output(
+            controller,
+            card,
+            entry,
+            CardAIExportFormat.JSON,
+            win,
+            pretty_cache.get(str(entry.output.outputId)),
+        )
 
     def export_selected_markdown() -> None:
         """Export the selected history entry to Markdown format."""
@@ -217,10 +591,40 @@ def _show_history(parent: tk.Misc, controller: CardAIController, card: CardDTO)
             return
         _export_output(controller, card, entry, CardAIExportFormat.HTML, win)
 
+    def run_history_action(
+        task: Callable[[], Tuple[List[CardAIHistoryEntryDTO], Optional[int]]],
+        message: str,
+        on_success: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """Run a history mutation in the worker pool and refresh the grid with its result."""
+
+        for button in (*managed_buttons, best_toggle_button):
+            if button is not None and button.winfo_exists():
+                button.configure(state=tk.DISABLED)
+
+        def finish(future: Future) -> None:
+            """Render the updated history or report the failure from the Tk thread."""
+
+            nonlocal history_entries
+            if not win.winfo_exists():
+                return
+            try:
+                entries, selected_output = future.result()
+            except RuntimeError as exc:
+                set_buttons_state()
+                messagebox.showerror("Error", str(exc))
+                return
+            if on_success is not None:
+                on_success()
+            history_entries = entries
+            populate_tree(history_entries, selected_output=selected_output)
+            messagebox.showinfo("Historial", message)
+
+        _submit_to_ui(win, task, finish)
+
     def delete_selected_entry() -> None:
         """Delete the selected history entry after confirmation."""
 
-        nonlocal history_entries
         key = get_selected_key()
         entry = get_selected_entry()
         if not key or not entry:
@@ -230,76 +634,68 @@ def _show_history(parent: tk.Misc, controller: CardAIController, card: CardDTO)
             "¿Deseas eliminar el resultado seleccionado del historial?",
         ):
             return
-        try:
-            controller.delete_output(entry.output.outputId)
-        except RuntimeError as exc:
-            messagebox.showerror("Error", str(exc))
-            return
-        history_entries = [
-            item for item in history_entries if item.output.outputId != entry.output.outputId
-        ]
-        populate_tree(history_entries)
-        messagebox.showinfo("Historial", "El resultado se eliminó correctamente.")
+        output_id = entry.output.outputId
+        current = history_entries
+
+        def task() -> Tuple[List[CardAIHistoryEntryDTO], Optional[int]]:
+            controller.delete_output(output_id)
+            return [item for item in current if item.output.outputId != output_id], None
+
+        run_history_action(task, "El resultado se eliminó correctamente.")
 
     def toggle_selected_best_flag() -> None:
         """Toggle the preferred flag for the selected entry."""
 
-        nonlocal history_entries
         entry = get_selected_entry()
         if not entry:
             return
+        output_id = entry.output.outputId
         target_state = not entry.output.isBest
-        try:
+
+        def task() -> Tuple[List[CardAIHistoryEntryDTO], Optional[int]]:
             if target_state:
-                controller.mark_output_as_best(entry.output.outputId)
+                controller.mark_output_as_best(output_id)
             else:
-                controller.clear_output_best_flag(entry.output.outputId)
-        except RuntimeError as exc:
-            messagebox.showerror("Error", str(exc))
-            return
-        try:
-            history_entries = controller.list_history(card.cardId)
-        except RuntimeError as exc:
-            messagebox.showerror("Error", str(exc))
-            return
-        populate_tree(history_entries, selected_output=entry.output.outputId)
-        if target_state:
-            messagebox.showinfo("Historial", "Se marcó la respuesta como mejor opción.")
-        else:
-            messagebox.showinfo("Historial", "Se quitó la marca de mejor respuesta.")
+                controller.clear_output_best_flag(output_id)
+            return controller.list_history(card.cardId), output_id
+
+        run_history_action(
+            task,
+            "Se marcó la respuesta como mejor opción."
+            if target_state
+            else "Se quitó la marca de mejor respuesta.",
+        )
 
     def toggle_selected_dde() -> None:
         """Toggle the DDE generated flag for the selected entry."""
 
-        nonlocal history_entries
         entry = get_selected_entry()
         if not entry:
             return
+        output_id = entry.output.outputId
         target_state = not entry.output.ddeGenerated
-        try:
-            controller.mark_output_dde_generated(entry.output.outputId, target_state)
-        except RuntimeError as exc:
-            messagebox.showerror("Error", str(exc))
-            return
-        try:
-            history_entries = controller.list_history(card.cardId)
-        except RuntimeError as exc:
-            messagebox.showerror("Error", str(exc))
-            return
-        populate_tree(history_entries, selected_output=entry.output.outputId)
-        if target_state:
-            messagebox.showinfo("Historial", "Se marcó la salida como DDE generada.")
-        else:
-            messagebox.showinfo("Historial", "Se quitó la marca de DDE generada.")
+
+        def task() -> Tuple[List[CardAIHistoryEntryDTO], Optional[int]]:
+            controller.mark_output_dde_generated(output_id, target_state)
+            return controller.list_history(card.cardId), output_id
+
+        run_history_action(
+            task,
+            "Se marcó la salida como DDE generada."
+            if target_state
+            else "Se quitó la marca de DDE generada.",
+        )
 
     def save_selected_changes() -> None:
         """Persist manual edits applied to the selected history entry."""
 
-        nonlocal history_entries
         entry = get_selected_entry()
         if not entry:
             return
-        raw_content = detail.get("1.0", "end").strip()
+        if _text_streaming(detail):
+            messagebox.showinfo("Historial", "Espera a que termine de cargarse el contenido.")
+            return
+        raw_content = _text_content(detail)
         if not raw_content:
             messagebox.showerror("Formato inv�lido", "El contenido no puede estar vac�o.")
             return
@@ -311,19 +707,21 @@ def _show_history(parent: tk.Misc, controller: CardAIController, card: CardDTO)
         if not isinstance(parsed, dict):
             messagebox.showerror("Formato inv�lido", "El JSON debe contener un objeto en la ra�z.")
             return
-        try:
-            updated_output = controller.update_output_content(entry.output.outputId, parsed)
-        except RuntimeError as exc:
-            messagebox.showerror("Error", str(exc))
-            return
-
-        updated_entry = CardAIHistoryEntryDTO(output=updated_output, input=entry.input)
-        history_entries = [
-            updated_entry if item.output.outputId == updated_output.outputId else item
-            for item in history_entries
-        ]
-        populate_tree(history_entries, selected_output=updated_output.outputId)
-        messagebox.showinfo("Historial", "Los cambios se guardaron correctamente.")
+        output_id = entry.output.outputId
+        current = history_entries
+
+        def task() -> Tuple[List[CardAIHistoryEntryDTO], Optional[int]]:
+            updated_output = controller.update_output_content(output_id, parsed)
+            updated_entry = CardAIHistoryEntryDTO(output=updated_output, input=entry.input)
+            return [
+                updated_entry if item.output.outputId == output_id else item for item in current
+            ], output_id
+
+        run_history_action(
+            task,
+            "Los cambios se guardaron correctamente.",
+            lambda: pretty_cache.pop(str(output_id), None),
+        )
 
     actions = tb.Frame(win, padding=(12, 0, 12, 12))
     actions.pack(fill=X)
@@ -407,36 +805,25 @@ def _show_history(parent: tk.Misc, controller: CardAIController, card: CardDTO)
     delete_button.pack(side=RIGHT, padx=(0, 6))
     managed_buttons.append(delete_button)
 
-    def populate_tree(entries: List[CardAIHistoryEntryDTO], selected_output: Optional[int] = None) -> None:
-        """Refresh the grid using the provided history collection."""
+    def populate_tree(
+        entries: List[CardAIHistoryEntryDTO],
+        selected_output: Optional[int] = None,
+        rows: Optional[List[CardRow]] = None,
+    ) -> None:
+        """Refresh the grid using the provided history collection and its prebuilt rows."""
 
+        if rows is None:
+            rows = [_history_row(entry) for entry in entries]
+        _store_history(card.cardId, entries, rows)
         entries_map.clear()
-        tree.delete(*tree.get_children(""))
-        selected_item: Optional[str] = None
-        for entry in entries:
-            completeness = entry.input.completenessPct if entry.input else 0
-            item_id = str(entry.output.outputId)
-            tags_list: List[str] = []
-            if entry.output.isBest:
-                tags_list.append("best")
-            if entry.output.ddeGenerated:
-                tags_list.append("dde")
-            tree.insert(
-                "",
-                "end",
-                iid=item_id,
-                values=(
-                    _format_datetime(entry.output.createdAt),
-                    entry.output.llmModel or "",
-                    f"{completeness}%",
-                    "Sí" if entry.output.isBest else "No",
-                    "Sí" if entry.output.ddeGenerated else "No",
-                ),
-                tags=tuple(tags_list),
-            )
-            entries_map[item_id] = entry
-            if selected_output and entry.output.outputId == selected_output:
-                selected_item = item_id
+        entries_map.update((item_id, entry) for (item_id, _, _), entry in zip(rows, entries))
+        _sync_tree_rows(tree, rows, rendered_rows, rendered_order)
+        selected_item = str(selected_output) if selected_output else None
+        if selected_item not in entries_map:
+            selected_item = None
+
+        for stale_key in pretty_cache.keys() - entries_map.keys():
+            del pretty_cache[stale_key]
 
         if selected_item:
             tree.selection_set(selected_item)
@@ -444,15 +831,36 @@ def _show_history(parent: tk.Misc, controller: CardAIController, card: CardDTO)
             first = tree.get_children("")
             if first:
                 tree.selection_set(first[0])
-        else:
-            detail.configure(state="normal")
-            detail.delete("1.0", "end")
-            detail.configure(state="disabled")
 
         on_select(None)
 
+    def apply_history(future: Future) -> None:
+        """Render the history loaded in the background or report the failure."""
+
+        nonlocal history_entries
+        if not win.winfo_exists():
+            return
+        try:
+            history_entries, rows = future.result()
+        except RuntimeError as exc:
+            messagebox.showerror("Error", str(exc))
+            win.destroy()
+            return
+        populate_tree(history_entries, rows=rows)
+
+    def load_history() -> Tuple[List[CardAIHistoryEntryDTO], List[CardRow]]:
+        """Fetch the history and build its grid rows in the worker thread."""
+
+        entries = controller.list_history(card.cardId)
+        return entries, [_history_row(entry) for entry in entries]
+
     tree.bind("<<TreeviewSelect>>", on_select)
-    populate_tree(history_entries)
+    cached_history = _cached_history(card.cardId)
+    if cached_history is not None:
+        history_entries = cached_history[0]
+        populate_tree(history_entries, rows=cached_history[1])
+    else:
+        _submit_to_ui(win, load_history, apply_history)
 
     win.wait_window()
 
@@ -487,9 +895,18 @@ def _show_generation_result(
     text = tk.Text(win, wrap="word")
     text.pack(fill=BOTH, expand=YES, padx=12, pady=8)
     text.configure(state="normal")
-    pretty = json.dumps(result.output.content, ensure_ascii=False, indent=2)
-    text.insert("1.0", pretty)
-    text.edit_modified(False)
+    rendered_json: Optional[str] = None
+
+    def _apply_content(future: Future) -> None:
+        """Insert the formatted JSON produced in the background."""
+
+        nonlocal rendered_json
+        if not text.winfo_exists():
+            return
+        rendered_json = future.result()
+        _show_text(text, rendered_json)
+
+    _submit_to_ui(win, lambda: _pretty_json(result.output.content), _apply_content)
 
     actions = tb.Frame(win, padding=12)
     actions.pack(fill=X)
@@ -498,7 +915,9 @@ def _show_generation_result(
         actions,
         text="Exportar JSON",
         bootstyle=SECONDARY,
-        command=lambda: _export_output(controller, card, result, CardAIExportFormat.JSON, win),
+        command=lambda: _export_output(
+            controller, card, result, CardAIExportFormat.JSON, win, rendered_json
+        ),
     ).pack(side=LEFT)
     tb.Button(
         actions,
@@ -545,24 +964,18 @@ def _show_generation_result(
                 continue
 
     def _background_call(func: Callable[[], None]) -> None:
-        """Execute the provided callback in a worker thread."""
-
-        def worker() -> None:
-            try:
-                func()
-            finally:
-                try:
-                    win.after(0, lambda: _set_running(False))
-                except tk.TclError:
-                    _set_running(False)
+        """Execute the provided callback in the shared worker pool."""
 
         _set_running(True)
-        threading.Thread(target=worker, daemon=True).start()
+        _submit_to_ui(win, func, lambda _done: _set_running(False))
 
     def save_changes() -> None:
         """Persist manual edits performed over the generated output."""
 
-        raw_content = text.get("1.0", "end").strip()
+        if _text_streaming(text):
+            messagebox.showinfo("Resultado", "Espera a que termine de cargarse el contenido.")
+            return
+        raw_content = _text_content(text)
         if not raw_content:
             messagebox.showerror("Formato inv�lido", "El contenido no puede estar vac�o.")
             return
@@ -580,23 +993,24 @@ def _show_generation_result(
                 updated_output = controller.update_output_content(result.output.outputId, parsed)
             except RuntimeError as exc:
                 error_message = str(exc)
-                win.after(
-                    0,
+                _post_to_ui(
+                    win,
                     lambda message=error_message: messagebox.showerror("Error", message),
                 )
                 return
 
-            formatted = json.dumps(updated_output.content, ensure_ascii=False, indent=2)
+            formatted = _pretty_json(updated_output.content)
 
             def _refresh() -> None:
+                nonlocal rendered_json
+                rendered_json = formatted
                 text.configure(state="normal")
-                text.delete("1.0", "end")
-                text.insert("1.0", formatted)
-                text.edit_modified(False)
+                _show_text(text, formatted)
                 result.output = updated_output
+                _HISTORY_CACHE.pop(card.cardId, None)
                 messagebox.showinfo("Resultado", "Los cambios se guardaron correctamente.")
 
-            win.after(0, _refresh)
+            _post_to_ui(win, _refresh)
 
         _background_call(_task)
 
@@ -618,12 +1032,13 @@ def _show_generation_result(
                 new_result = controller.regenerate(result.input.inputId)
             except RuntimeError as exc:
                 error_message = str(exc)
-                win.after(0, lambda message=error_message: messagebox.showerror("Error", message))
+                _post_to_ui(win, lambda message=error_message: messagebox.showerror("Error", message))
                 return
 
-            win.after(
-                0,
+            _post_to_ui(
+                win,
                 lambda: (
+                    _HISTORY_CACHE.pop(card.cardId, None),
                     win.destroy(),
                     _show_generation_result(parent, controller, card, new_result),
                 ),
@@ -649,14 +1064,7 @@ def _open_capture_form(
     win.transient(root)
     win.grab_set()
 
-    vars_data = {
-        "tipo": tk.StringVar(value=card.cardType or TYPE_CHOICES[0]),
-        "descripcion": tk.StringVar(value=""),
-        "analisis": tk.StringVar(value=""),
-        "recomendaciones": tk.StringVar(value=""),
-        "cosas_prevenir": tk.StringVar(value=""),
-        "info_adicional": tk.StringVar(value=""),
-    }
+    vars_data = {"tipo": tk.StringVar(value=card.cardType or TYPE_CHOICES[0])}
 
     provider_value_map: Dict[str, str] = {}
     provider_options: List[str] = []
@@ -693,35 +1101,73 @@ def _open_capture_form(
     provider_var = tk.StringVar(value=default_provider_label)
     vars_data["provider"] = provider_var
 
-    def _as_payload() -> Dict[str, object]:
-        """Collect the current state of the form."""
-
-        return {
-            "cardId": card.cardId,
-            "tipo": vars_data["tipo"].get(),
-            "descripcion": descripcion.get("1.0", "end").strip(),
-            "analisis": analisis.get("1.0", "end").strip(),
-            "recomendaciones": recomendaciones.get("1.0", "end").strip(),
-            "cosasPrevenir": prevenir.get("1.0", "end").strip(),
-            "infoAdicional": adicional.get("1.0", "end").strip(),
-            "providerKey": provider_value_map.get(provider_var.get()),
-        }
-
-    def _update_progress(*_args: object) -> None:
-        """Recalculate completeness when fields change."""
-
-        payload = _as_payload()
-        completeness = _calculate_completeness(
-            {
-                "descripcion": payload["descripcion"],
-                "analisis": payload["analisis"],
-                "recomendaciones": payload["recomendaciones"],
-                "cosas_prevenir": payload["cosasPrevenir"],
-                "info_adicional": payload["infoAdicional"],
-            }
-        )
+    def _collect_payload() -> Dict[str, object]:
+        """Collect the current state of the form for submission."""
+
+        payload: Dict[str, object] = {"cardId": card.cardId, "tipo": vars_data["tipo"].get()}
+        for key, _label, payload_key, _height in CAPTURE_TEXT_FIELDS:
+            payload[payload_key] = _field_text(key)
+        payload["providerKey"] = provider_value_map.get(provider_var.get())
+        return payload
+
+    text_cache: Dict[str, str] = {}
+
+    def _field_text(key: str) -> str:
+        """Return the stripped content of a field, reading the widget only after it changed."""
+
+        value = text_cache.get(key)
+        if value is None:
+            value = text_cache[key] = _text_content(text_fields[key])
+        return value
+
+    def _on_modified(key: str, widget: tk.Text) -> None:
+        """Drop the cached content of an edited field and schedule the completeness refresh."""
+
+        if not widget.edit_modified():
+            return
+        widget.edit_modified(False)
+        text_cache.pop(key, None)
+        _mark_dirty(key)
+
+    filled_mask = 0
+    dirty_fields: Set[str] = set()
+    progress_job: Optional[str] = None
+    last_completeness: Optional[int] = None
+    progress_bootstyle = "danger"
+
+    def _mark_dirty(key: str) -> None:
+        """Flag a text field as modified and schedule one completeness refresh per interval.
+
+        While a refresh is pending further keystrokes only record the field, so typing does not
+        cancel and recreate the Tk timer on every key.
+        """
+
+        nonlocal progress_job
+        dirty_fields.add(key)
+        if progress_job is None:
+            progress_job = win.after(150, _update_progress)
+
+    def _update_progress() -> None:
+        """Recalculate completeness re-reading only the fields that changed."""
+
+        nonlocal progress_job, last_completeness, filled_mask, progress_bootstyle
+        progress_job = None
+        if not progress.winfo_exists():
+            return
+        for key in dirty_fields:
+            bit = COMPLETENESS_FIELD_BITS[key]
+            cached = text_cache.get(key)
+            if cached if cached is not None else _has_text(text_fields[key]):
+                filled_mask |= bit
+            else:
+                filled_mask &= ~bit
+        dirty_fields.clear()
+        completeness = _completeness_from_mask(filled_mask)
+        if completeness == last_completeness:
+            return
+        last_completeness = completeness
         progress.configure(value=completeness)
-        _progress_style(progress, completeness)
+        progress_bootstyle = _progress_style(progress, completeness, progress_bootstyle)
         status.set(f"Completitud estimada: {completeness}%")
 
     container = tb.Frame(win, padding=12)
@@ -747,28 +1193,18 @@ def _open_capture_form(
 
     tb.Label(container, text="Tipo").grid(row=current_row, column=0, sticky="w")
     tipo_box = ttk.Combobox(
-        container, values=list(TYPE_CHOICES), textvariable=vars_data["tipo"], state="readonly"
+        container, values=TYPE_CHOICES, textvariable=vars_data["tipo"], state="readonly"
     )
     tipo_box.grid(row=current_row, column=1, sticky="we")
     current_row += 1
 
-    descripcion = tk.Text(container, height=5, wrap="word")
-    analisis = tk.Text(container, height=5, wrap="word")
-    recomendaciones = tk.Text(container, height=5, wrap="word")
-    prevenir = tk.Text(container, height=5, wrap="word")
-    adicional = tk.Text(container, height=4, wrap="word")
-
-    labels = [
-        ("Descripción", descripcion),
-        ("Análisis", analisis),
-        ("Recomendaciones", recomendaciones),
-        ("Cosas a prevenir", prevenir),
-        ("Información adicional", adicional),
-    ]
+    text_fields: Dict[str, tk.Text] = {}
     row = current_row
-    for label, widget in labels:
+    for key, label, _payload_key, height in CAPTURE_TEXT_FIELDS:
+        widget = tk.Text(container, height=height, wrap="word")
         tb.Label(container, text=label).grid(row=row, column=0, sticky="nw", pady=(8, 0))
         widget.grid(row=row, column=1, sticky="nsew", pady=(8, 0))
+        text_fields[key] = widget
         row += 1
 
     container.grid_columnconfigure(1, weight=1)
@@ -776,7 +1212,7 @@ def _open_capture_form(
         container.grid_rowconfigure(idx, weight=1)
 
     status = tk.StringVar(value="Completa los campos para mejorar el resultado.")
-    progress = tb.Progressbar(container, maximum=100, bootstyle="danger")
+    progress = tb.Progressbar(container, maximum=100, bootstyle=progress_bootstyle)
     progress.grid(row=row, column=0, columnspan=2, sticky="we", pady=(12, 0))
     tb.Label(container, textvariable=status, bootstyle=SECONDARY).grid(row=row + 1, column=0, columnspan=2, sticky="w")
 
@@ -800,70 +1236,62 @@ def _open_capture_form(
                 continue
 
     def _background_call(func: Callable[[], None]) -> None:
-        """Execute the given callable in a worker thread."""
-
-        def worker() -> None:
-            try:
-                func()
-            finally:
-                try:
-                    win.after(0, lambda: _set_running(False))
-                except tk.TclError:
-                    _set_running(False)
+        """Execute the given callable in the shared worker pool."""
 
         _set_running(True)
-        threading.Thread(target=worker, daemon=True).start()
+        _submit_to_ui(win, func, lambda _done: _set_running(False))
 
     def _save_draft() -> None:
         """Save the current content as draft."""
 
-        payload = _as_payload()
+        payload = _collect_payload()
 
         def _task() -> None:
             try:
                 controller.save_draft(payload)
             except RuntimeError as exc:
                 error_message = str(exc)
-                win.after(
-                    0,
+                _post_to_ui(
+                    win,
                     lambda message=error_message: messagebox.showerror("Error", message),
                 )
                 return
-            win.after(0, lambda: messagebox.showinfo("Guardado", "Se guardó el borrador correctamente."))
+            _post_to_ui(win, lambda: messagebox.showinfo("Guardado", "Se guardó el borrador correctamente."))
 
         _background_call(_task)
 
     def _generate() -> None:
         """Call the controller to generate the document."""
 
-        payload = _as_payload()
-        completeness = _calculate_completeness(
-            {
-                "descripcion": payload["descripcion"],
-                "analisis": payload["analisis"],
-                "recomendaciones": payload["recomendaciones"],
-                "cosas_prevenir": payload["cosasPrevenir"],
-                "info_adicional": payload["infoAdicional"],
-            }
-        )
-        if completeness < 34:
+        if progress_job is not None:
+            win.after_cancel(progress_job)
+            _update_progress()
+        if (last_completeness or 0) < 34:
             if not messagebox.askyesno(
                 "Completitud baja",
                 "La completitud es menor al 34%. ¿Deseas continuar de todos modos?",
             ):
                 return
+        payload = _collect_payload()
 
         def _task() -> None:
             try:
                 result = controller.generate_document(payload)
             except RuntimeError as exc:
                 error_message = str(exc)
-                win.after(
-                    0,
+                _post_to_ui(
+                    win,
                     lambda message=error_message: messagebox.showerror("Error", message),
                 )
                 return
-            win.after(0, lambda: (win.destroy(), _show_generation_result(root, controller, card, result)))
+            _post_to_ui(
+                win,
+                lambda: (
+                    _HISTORY_CACHE.pop(card.cardId, None),
+                    win.destroy(),
+                    _show_generation_result(root, controller, card, result),
+                ),
+            )
 
         _background_call(_task)
 
@@ -871,8 +1299,12 @@ def _open_capture_form(
     tb.Button(buttons, text="Generar (IA)", bootstyle=PRIMARY, command=_generate).pack(side=LEFT, padx=6)
     tb.Button(buttons, text="Cancelar", bootstyle=DANGER, command=win.destroy).pack(side=RIGHT)
 
-    for widget in (descripcion, analisis, recomendaciones, prevenir, adicional):
-        widget.bind("<KeyRelease>", _update_progress, add="+")
+    for key, widget in text_fields.items():
+        # Fields start empty, matching the initial mask, so the first refresh reads no widget.
+        text_cache[key] = ""
+        widget.bind(
+            "<<Modified>>", lambda _event, field=key, text=widget: _on_modified(field, text), add="+"
+        )
 
     _update_progress()
     win.wait_window()
@@ -911,10 +1343,10 @@ def build_cards_ai_view(
         company_options = []
 
     incident_type_map = {option.name: option.optionId for option in incident_type_options}
-    incident_type_values = [""] + [option.name for option in incident_type_options]
-    status_values = [""] + status_options
+    incident_type_values = ("", *(option.name for option in incident_type_options))
+    status_values = ("", *status_options)
     company_map = {option.name: option.optionId for option in company_options}
-    company_values = [""] + [option.name for option in company_options]
+    company_values = ("", *(option.name for option in company_options))
 
     tb.Label(filters_frame, text="Tipo incidente").grid(row=0, column=0, sticky="w")
     tipo_var = tk.StringVar(value="")
@@ -972,8 +1404,8 @@ def build_cards_ai_view(
 
     filters_frame.grid_columnconfigure(5, weight=1)
 
-    best_filter_var = tk.StringVar(value="Todas")
-    dde_filter_var = tk.StringVar(value="Todas")
+    best_filter_var = tk.StringVar(value=BEST_FILTER_CHOICES[0])
+    dde_filter_var = tk.StringVar(value=DDE_FILTER_CHOICES[0])
 
     table_frame = tb.Frame(parent, padding=(12, 0))
     table_frame.pack(fill=BOTH, expand=YES)
@@ -993,15 +1425,15 @@ def build_cards_ai_view(
     tree["displaycolumns"] = columns
 
     active_sort: Dict[str, Optional[str]] = {"column": None, "direction": None}
+    rendered_rows: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {}
+    rendered_order: List[str] = []
 
     def _coerce_sort_value(value: str, column: str) -> object:
         """Return a comparable value for sorting operations."""
 
-        if column == "actualizado" and value:
-            try:
-                return datetime.strptime(value, "%Y-%m-%d %H:%M")
-            except ValueError:
-                return value
+        if column == "actualizado":
+            # "%Y-%m-%d %H:%M" is zero padded, so the text already sorts chronologically.
+            return value
         if column == "ticket":
             try:
                 return int(value)
@@ -1015,6 +1447,14 @@ def build_cards_ai_view(
         except (TypeError, ValueError):
             return normalized
 
+    def _sort_pairs(items: List[Tuple[str, object]], column: str, reverse: bool) -> None:
+        """Sort ``(cell value, payload)`` pairs in place using the column semantics."""
+
+        try:
+            items.sort(key=lambda item: _coerce_sort_value(item[0], column), reverse=reverse)
+        except TypeError:
+            items.sort(key=lambda item: str(item[0]).lower(), reverse=reverse)
+
     def _sort_tree(column: str, force_direction: Optional[str] = None) -> None:
         """Sort the tree rows using the provided column."""
 
@@ -1026,14 +1466,12 @@ def build_cards_ai_view(
                 direction = "asc"
         active_sort["column"] = column
         active_sort["direction"] = direction
-        items = [(tree.set(item_id, column), item_id) for item_id in tree.get_children("")]
-        reverse = direction == "desc"
-        try:
-            items.sort(key=lambda item: _coerce_sort_value(item[0], column), reverse=reverse)
-        except TypeError:
-            items.sort(key=lambda item: str(item[0]).lower(), reverse=reverse)
+        value_index = columns.index(column)
+        items = [(rendered_rows[item_id][0][value_index], item_id) for item_id in rendered_order]
+        _sort_pairs(items, column, direction == "desc")
         for index, (_, item_id) in enumerate(items):
             tree.move(item_id, "", index)
+        rendered_order[:] = [item_id for _, item_id in items]
 
     for column_name, column_config in columns_config.items():
         tree.heading(column_name, text=column_config["text"], command=lambda col=column_name: _sort_tree(col))
@@ -1058,16 +1496,20 @@ def build_cards_ai_view(
     status_label.pack(side=LEFT)
 
     column_vars: Dict[str, tk.BooleanVar] = {}
+    visible_columns: Set[str] = set(columns)
 
-    def _toggle_column(column: str) -> None:
+    def _toggle_column(column: str, variable: tk.BooleanVar) -> None:
         """Hide or show the requested column ensuring at least one stays visible."""
 
-        visible_columns = [name for name in columns if column_vars[name].get()]
-        if not visible_columns:
-            column_vars[column].set(True)
+        if variable.get():
+            visible_columns.add(column)
+        elif visible_columns == {column}:
+            variable.set(True)
             messagebox.showinfo("Columnas", "Debe permanecer al menos una columna visible.")
             return
-        tree["displaycolumns"] = visible_columns
+        else:
+            visible_columns.discard(column)
+        tree["displaycolumns"] = tuple(name for name in columns if name in visible_columns)
 
     column_button = ttk.Menubutton(actions_frame, text="Columnas")
     column_menu = tk.Menu(column_button, tearoff=False)
@@ -1078,97 +1520,144 @@ def build_cards_ai_view(
         column_menu.add_checkbutton(
             label=column_config["text"],
             variable=var,
-            command=lambda col=column_name: _toggle_column(col),
+            command=lambda col=column_name, variable=var: _toggle_column(col, variable),
         )
     history_button = tb.Button(
         actions_frame,
         text="Historial",
         bootstyle=INFO,
         state=tk.DISABLED,
-        command=lambda: _show_history(root, controller, selected_card[0])
-        if selected_card
-        else None,
+        command=lambda: _open_modal(_show_history),
     )
     generate_button = tb.Button(
         actions_frame,
         text="Generar DDE/HU",
         bootstyle=PRIMARY,
         state=tk.DISABLED,
-        command=lambda: _open_capture_form(root, controller, selected_card[0]) if selected_card else None,
+        command=lambda: _open_modal(_open_capture_form),
     )
     generate_button.pack(side=RIGHT)
     history_button.pack(side=RIGHT, padx=(0, 6))
     column_button.pack(side=RIGHT, padx=(0, 6))
 
     selected_card: List[CardDTO] = []
-    current_cards: List[CardDTO] = []
+    cards_by_id: Dict[int, CardDTO] = {}
+
+    def _open_modal(opener: Callable[[tk.Misc, CardAIController, CardDTO], None]) -> None:
+        """Open a modal for the selected card and drop cached listings it may have changed."""
+
+        if not selected_card:
+            return
+        opener(root, controller, selected_card[0])
+        cards_cache.clear()
 
     def _parse_date(entry: DateEntry) -> Optional[datetime]:
         """Return the selected date or ``None`` when the field is empty."""
 
-        value = entry.entry.get().strip()
-        if not value:
-            return None
-        try:
-            return datetime.strptime(value + " 00:00", "%Y-%m-%d %H:%M")
-        except ValueError:
-            return None
+        return _parse_filter_date(entry.entry.get().strip())
+
+    filter_readers: Dict[str, Callable[[], object]] = {
+        "tipoId": lambda: incident_type_map.get(tipo_var.get().strip()),
+        "status": lambda: status_var.get().strip() or None,
+        "empresaId": lambda: company_map.get(company_var.get().strip()),
+        "fechaInicio": lambda: _parse_date(start_var),
+        "fechaFin": lambda: _parse_date(end_var),
+        "busqueda": lambda: search_var.get().strip() or None,
+        "estadoMejor": best_filter_var.get,
+        "estadoDde": dde_filter_var.get,
+    }
+    current_filters: Dict[str, object] = {}
+
+    def _refresh_filter(key: str) -> None:
+        """Re-read only the filter bound to ``key`` and reload the cards."""
+
+        current_filters[key] = filter_readers[key]()
+        _refresh()
+
+    def _refresh_filter_if_changed(key: str) -> None:
+        """Reload the cards when the filter bound to ``key`` no longer matches the applied one."""
+
+        if filter_readers[key]() != current_filters.get(key):
+            _refresh_filter(key)
+
+    refresh_generation = 0
+    cards_cache: "OrderedDict[Tuple[object, ...], Tuple[float, List[CardDTO], List[CardRow]]]" = OrderedDict()
+
+    refresh_future: Optional[Future] = None
 
     def _refresh() -> None:
-        """Load the cards from the controller applying filters."""
-
-        selected_type = tipo_var.get().strip()
-        selected_status = status_var.get().strip()
-        selected_company = company_var.get().strip()
-        filters: Dict[str, object] = {
-            "fechaInicio": _parse_date(start_var),
-            "fechaFin": _parse_date(end_var),
-            "busqueda": search_var.get().strip() or None,
-            "estadoMejor": best_filter_var.get(),
-            "estadoDde": dde_filter_var.get(),
-        }
-        if selected_type:
-            filters["tipoId"] = incident_type_map.get(selected_type)
-        if selected_status:
-            filters["status"] = selected_status
-        if selected_company:
-            filters["empresaId"] = company_map.get(selected_company)
+        """Load the cards from the controller applying filters in a worker thread."""
+
+        nonlocal refresh_generation, refresh_future
+        refresh_generation += 1
+        if refresh_future is not None:
+            # A superseded request that has not started yet never reaches the controller.
+            refresh_future.cancel()
+            refresh_future = None
+        generation = refresh_generation
+        # Dates typed by hand fire no <<DateEntrySelected>>, so they are re-read on every reload.
+        current_filters.update((key, filter_readers[key]()) for key in DATE_FILTER_KEYS)
+        filters = dict(current_filters)
+        cache_key = tuple(filters.items())
+        cached = cards_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < CARDS_CACHE_TTL_SECONDS:
+            cards_cache.move_to_end(cache_key)
+            _render_cards(cached[1], cached[2])
+            return
+        status_label.configure(text="Cargando tarjetas...")
+        refresh_future = _submit_to_ui(
+            parent,
+            lambda: _load_cards(filters),
+            lambda done: _apply_cards(generation, cache_key, done),
+        )
+
+    def _load_cards(filters: Dict[str, object]) -> Tuple[List[CardDTO], List[CardRow]]:
+        """Fetch the cards and build their grid rows in the worker thread."""
+
+        cards = controller.list_cards(filters)
+        card_row = _card_row
+        return cards, [card_row(card) for card in cards]
+
+    def _apply_cards(generation: int, cache_key: Tuple[object, ...], future: Future) -> None:
+        """Cache and render the cards returned by the worker unless a newer refresh was requested."""
+
+        nonlocal refresh_future
+        if generation != refresh_generation or not tree.winfo_exists():
+            return
+        refresh_future = None
         try:
-            cards = controller.list_cards(filters)
+            cards, rows = future.result()
         except RuntimeError as exc:
             messagebox.showerror("Error", str(exc))
             return
+        cards_cache[cache_key] = (time.monotonic(), cards, rows)
+        cards_cache.move_to_end(cache_key)
+        if len(cards_cache) > CARDS_CACHE_MAX_ENTRIES:
+            cards_cache.popitem(last=False)
+        _render_cards(cards, rows)
+
+    def _sync_rows(rows: List[CardRow]) -> None:
+        """Update the grid to match ``rows`` touching only the rows that changed."""
 
-        current_cards[:] = cards
+        if tree.selection():
+            tree.selection_remove(tree.selection())
+        _sync_tree_rows(tree, rows, rendered_rows, rendered_order)
+
+    def _render_cards(cards: List[CardDTO], rows: List[CardRow]) -> None:
+        """Populate the grid with the provided cards and their prebuilt rows."""
+
+        cards_by_id.clear()
+        cards_by_id.update((card.cardId, card) for card in cards)
         selected_card.clear()
         generate_button.configure(state=tk.DISABLED)
         history_button.configure(state=tk.DISABLED)
-        tree.delete(*tree.get_children(""))
-        for card in cards:
-            tags_list: List[str] = []
-            if card.hasBestSelection:
-                tags_list.append("best")
-            if card.hasDdeGenerated:
-                tags_list.append("dde")
-            formatted_date = _format_datetime(card.updatedAt or card.createdAt)
-            tree.insert(
-                "",
-                "end",
-                iid=str(card.cardId),
-                values=(
-                    card.ticketId or str(card.cardId),
-                    card.title,
-                    card.incidentTypeName or "",
-                    card.status,
-                    card.companyName or "",
-                    formatted_date,
-                    "Si" if card.hasBestSelection else "No",
-                    "Si" if card.hasDdeGenerated else "No",
-                ),
-                tags=tuple(tags_list),
-            )
-        if active_sort["column"] and active_sort["direction"]:
-            _sort_tree(active_sort["column"], force_direction=active_sort["direction"])
+        sort_column = active_sort["column"]
+        if sort_column and active_sort["direction"]:
+            value_index = columns.index(sort_column)
+            keyed = [(row[1][value_index], row) for row in rows]
+            _sort_pairs(keyed, sort_column, active_sort["direction"] == "desc")
+            rows = [row for _, row in keyed]
+        _sync_rows(rows)
         status_label.configure(text=f"{len(cards)} tarjeta(s) encontradas.")
 
     def _on_select(event: tk.Event) -> None:
@@ -1179,11 +1668,9 @@ def build_cards_ai_view(
             selected_card.clear()
             generate_button.configure(state=tk.DISABLED)
             return
-        card_id = int(selection[0])
-        for card in current_cards:
-            if card.cardId == card_id:
-                selected_card[:] = [card]
-                break
+        card = cards_by_id.get(int(selection[0]))
+        if card is not None:
+            selected_card[:] = [card]
         state = tk.NORMAL if selected_card else tk.DISABLED
         generate_button.configure(state=state)
         history_button.configure(state=state)
@@ -1192,18 +1679,28 @@ def build_cards_ai_view(
 
     debounce_id = None
 
-    def _schedule_refresh(*_args: object) -> None:
-        """Apply debounce to the search entry."""
+    def _schedule_refresh(event: Optional[tk.Event] = None) -> None:
+        """Apply debounce to the search entry, ignoring keys that cannot change its text."""
 
         nonlocal debounce_id
+        if event is not None and getattr(event, "keysym", "") in SEARCH_IGNORED_KEYSYMS:
+            return
         if debounce_id is not None:
             parent.after_cancel(debounce_id)
-        debounce_id = parent.after(300, _refresh)
+        debounce_id = parent.after(300, _refresh_search)
+
+    def _refresh_search() -> None:
+        """Reload the cards only when the search text actually changed."""
+
+        nonlocal debounce_id
+        debounce_id = None
+        if filter_readers["busqueda"]() != current_filters.get("busqueda"):
+            _refresh_filter("busqueda")
 
     tb.Label(filters_frame, text="Mejor respuesta").grid(row=2, column=0, sticky="w", pady=(8, 0))
     best_filter_box = ttk.Combobox(
         filters_frame,
-        values=("Todas", "Con mejor respuesta", "Sin mejor respuesta"),
+        values=BEST_FILTER_CHOICES,
         textvariable=best_filter_var,
         state="readonly",
         width=22,
@@ -1214,7 +1711,7 @@ def build_cards_ai_view(
     tb.Label(filters_frame, text="DDE generada").grid(row=2, column=1, sticky="w", pady=(8, 0))
     dde_filter_box = ttk.Combobox(
         filters_frame,
-        values=("Todas", "Con DDE generada", "Sin DDE generada"),
+        values=DDE_FILTER_CHOICES,
         textvariable=dde_filter_var,
         state="readonly",
         width=22,
@@ -1222,13 +1719,45 @@ def build_cards_ai_view(
     dde_filter_box.grid(row=3, column=1, sticky="we", padx=(0, 10))
     dde_filter_box.current(0)
 
-    for widget in (tipo_box, status_box, company_box):
-        widget.bind("<<ComboboxSelected>>", lambda *_: _refresh(), add="+")
-    start_var.bind("<<DateEntrySelected>>", lambda *_: _refresh(), add="+")
-    end_var.bind("<<DateEntrySelected>>", lambda *_: _refresh(), add="+")
-    search_var.trace_add("write", lambda *_: _schedule_refresh())
-    best_filter_box.bind("<<ComboboxSelected>>", lambda *_: _refresh(), add="+")
-    dde_filter_box.bind("<<ComboboxSelected>>", lambda *_: _refresh(), add="+")
+    filter_widgets = (
+        (tipo_box, "<<ComboboxSelected>>", "tipoId"),
+        (status_box, "<<ComboboxSelected>>", "status"),
+        (company_box, "<<ComboboxSelected>>", "empresaId"),
+        (start_var, "<<DateEntrySelected>>", "fechaInicio"),
+        (end_var, "<<DateEntrySelected>>", "fechaFin"),
+        (best_filter_box, "<<ComboboxSelected>>", "estadoMejor"),
+        (dde_filter_box, "<<ComboboxSelected>>", "estadoDde"),
+    )
+    for widget, sequence, filter_key in filter_widgets:
+        widget.bind(sequence, lambda *_, key=filter_key: _refresh_filter(key), add="+")
+    for sequence in ("<KeyRelease>", "<<Paste>>", "<<Cut>>"):
+        search_entry.bind(sequence, _schedule_refresh, add="+")
+    for date_entry, filter_key in zip((start_var, end_var), DATE_FILTER_KEYS):
+        for sequence in ("<FocusOut>", "<Return>", "<KP_Enter>"):
+            date_entry.entry.bind(
+                sequence, lambda *_, key=filter_key: _refresh_filter_if_changed(key), add="+"
+            )
+
+    def _teardown(event: tk.Event) -> None:
+        """Stop pending timers and refreshes when the view is rebuilt or closed."""
+
+        nonlocal debounce_id, refresh_generation, refresh_future
+        if event.widget is not filters_frame:
+            return
+        if debounce_id is not None:
+            try:
+                parent.after_cancel(debounce_id)
+            except tk.TclError:
+                pass
+            debounce_id = None
+        # Results still in flight see a newer generation and are dropped.
+        refresh_generation += 1
+        if refresh_future is not None:
+            refresh_future.cancel()
+            refresh_future = None
+
+    filters_frame.bind("<Destroy>", _teardown, add="+")
 
+    current_filters.update((key, reader()) for key, reader in filter_readers.items())
     _refresh()
 
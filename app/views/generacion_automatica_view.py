@@ -5,15 +5,215 @@ from __future__ import annotations
 import csv
 import datetime
 import itertools
+import math
 import os
 import re
-from typing import Callable
+import threading
+from functools import lru_cache
+from typing import Callable, Iterator
 import tkinter as tk
 from tkinter import messagebox, ttk
 
+import numpy as np
 import ttkbootstrap as tb
 from ttkbootstrap.constants import DANGER, INFO, PRIMARY, SECONDARY
 
+from app.views.virtual_tree import VirtualTreeWindow
+
+
+INVALID_RESULT_PATTERN = re.compile(r"inv[aá]lido", re.IGNORECASE)
+RULE_OPERATOR_PATTERN = re.compile(r"(&&|\|\|)")
+INVALID_FILENAME_TABLE = str.maketrans(dict.fromkeys('\\/:*?"<>|', "_"))
+PREVIEW_WINDOW_SIZE = 200
+CSV_WRITE_BUFFER_SIZE = 1 << 16
+RULE_BLOCK_SIZE = 1 << 16
+
+# (first column, matching value positions, [(operator, column, positions), ...]); rules are
+# evaluated over value positions, and an empty position set never matches.
+CompiledRule = tuple[int, frozenset[int], list[tuple[str, int, frozenset[int]]]]
+
+
+def _iter_invalid_blocks(sizes: list[int], compiled: list[CompiledRule]) -> Iterator[np.ndarray]:
+    """Yield the invalid flags of the combinations as boolean arrays of ``RULE_BLOCK_SIZE``.
+
+    The flags follow the ``itertools.product`` order of the value positions. Each block decodes
+    only its own slice of the product, so memory stays bounded whatever the matrix size.
+    """
+
+    total = math.prod(sizes)
+    def as_array(positions: frozenset[int]) -> np.ndarray:
+        """Return the value positions as an index array for ``np.isin``."""
+
+        return np.fromiter(positions, dtype=np.intp, count=len(positions))
+
+    rules = [
+        (column, as_array(positions), [(operator, col, as_array(pos)) for operator, col, pos in rest])
+        for column, positions, rest in compiled
+    ]
+    for start in range(0, total, RULE_BLOCK_SIZE):
+        grid = np.unravel_index(np.arange(start, min(start + RULE_BLOCK_SIZE, total)), sizes)
+        invalid = np.zeros(grid[0].shape, dtype=bool)
+        for column, positions, rest in rules:
+            value = np.isin(grid[column], positions)
+            for operator, column, positions in rest:
+                mask = np.isin(grid[column], positions)
+                value = (value & mask) if operator == "&&" else (value | mask)
+            invalid |= value
+        yield invalid
+
+
+@lru_cache(maxsize=32)
+def _default_template(var_names: tuple[str, ...]) -> str:
+    """Return the default test case template for the given variable names."""
+
+    parts = [f"{name} es {{{name}}}" for name in var_names]
+    return "Validar el sistema cuando " + ", ".join(parts)
+
+
+@lru_cache(maxsize=32)
+def _parse_rules(text: str) -> list[dict[str, object]]:
+    """Parse the invalidation rules typed by the user.
+
+    The result is cached by the raw text and shared between calls, so callers must not mutate it.
+    """
+
+    rules: list[dict[str, object]] = []
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    for line in lines:
+        if "=>" not in line:
+            continue
+        conditions, result = [part.strip() for part in line.split("=>", 1)]
+        if not INVALID_RESULT_PATTERN.search(result):
+            continue
+        tokens = RULE_OPERATOR_PATTERN.split(conditions)
+        terms = [token.strip() for token in tokens if token.strip()]
+        cond_terms: list[dict[str, str]] = []
+        operators: list[str] = []
+        for token in terms:
+            if token in ("&&", "||"):
+                operators.append(token)
+            else:
+                key, _, value = token.partition("=")
+                cond_terms.append({"key": key.strip(), "val": value.strip()})
+        rules.append({"parts": cond_terms, "ops": operators})
+    return rules
+
+
+def _compile_rules(
+    rules: list[dict[str, object]], var_names: list[str], value_lists: list[list[str]]
+) -> list[CompiledRule]:
+    """Encode every rule term once as the column and value positions it matches."""
+
+    columns = {name: index for index, name in enumerate(var_names)}
+
+    def encode(term: dict[str, str]) -> tuple[int, frozenset[int]]:
+        """Return the column and matching positions of a term; unknown variables match nothing."""
+
+        column = columns.get(term["key"])
+        if column is None:
+            return 0, frozenset()
+        return column, frozenset(pos for pos, item in enumerate(value_lists[column]) if item == term["val"])
+
+    compiled: list[CompiledRule] = []
+    for rule in rules:
+        parts = rule["parts"]
+        if not parts:
+            continue
+        operators = rule["ops"]
+        terms = [encode(term) for term in parts]  # type: ignore[union-attr]
+        rest = [
+            (operators[idx] if idx < len(operators) else "&&", column, positions)  # type: ignore[index,arg-type]
+            for idx, (column, positions) in enumerate(terms[1:])
+        ]
+        compiled.append((terms[0][0], terms[0][1], rest))
+    return compiled
+
+
+def _evaluate_rules(compiled: list[CompiledRule], offsets: tuple[int, ...]) -> bool:
+    """Return True when the combination of value positions is invalid according to the rules.
+
+    Terms are folded left to right; a term is skipped when the operator cannot change the value.
+    """
+
+    for column, positions, rest in compiled:
+        value = offsets[column] in positions
+        for operator, column, positions in rest:
+            if (operator == "&&") == value:
+                value = offsets[column] in positions
+        if value:
+            return True
+    return False
+
+
+def _iter_invalid_flags(sizes: list[int], compiled: list[CompiledRule]) -> Iterator[bool]:
+    """Yield the invalid flag of every combination in ``itertools.product`` order."""
+
+    if not compiled:
+        yield from itertools.repeat(False, math.prod(sizes))
+        return
+    for block in _iter_invalid_blocks(sizes, compiled):
+        yield from block.tolist()
+
+
+class _PreviewMatrix:
+    """Rows of one Cartesian product of variable values, computed on demand."""
+
+    def __init__(
+        self,
+        var_names: list[str],
+        value_lists: list[list[str]],
+        template: str,
+        compiled: list[CompiledRule],
+    ) -> None:
+        """Store the snapshot of the inputs used to derive every row."""
+
+        self.var_names = var_names
+        self._value_lists = value_lists
+        self._template = template
+        self._compiled = compiled
+        self._sizes = [len(values) for values in value_lists]
+        self._pattern = re.compile(r"\{(" + "|".join(map(re.escape, var_names)) + r")\}")
+        self._positions = {name: position for position, name in enumerate(var_names)}
+        self.total = math.prod(self._sizes)
+
+    def __len__(self) -> int:
+        """Return the number of combinations in the product."""
+
+        return self.total
+
+    def __iter__(self) -> Iterator[list[str]]:
+        """Yield every row in order without materializing the whole product."""
+
+        offsets_iter = itertools.product(*map(range, self._sizes))
+        flags = _iter_invalid_flags(self._sizes, self._compiled)
+        for index, (offsets, is_invalid) in enumerate(zip(offsets_iter, flags)):
+            yield self._format(index, offsets, is_invalid)
+
+    def row(self, index: int) -> list[str]:
+        """Return the row at ``index`` by decoding its position in the product."""
+
+        picks: list[int] = []
+        remainder = index
+        for size in reversed(self._sizes):
+            remainder, offset = divmod(remainder, size)
+            picks.append(offset)
+        offsets = tuple(reversed(picks))
+        return self._format(index, offsets, _evaluate_rules(self._compiled, offsets))
+
+    def count_invalid(self) -> int:
+        """Return how many combinations the rules mark as invalid."""
+
+        if not self._compiled:
+            return 0
+        return sum(int(np.count_nonzero(block)) for block in _iter_invalid_blocks(self._sizes, self._compiled))
+
+    def _format(self, index: int, offsets: tuple[int, ...], is_invalid: bool) -> list[str]:
+        """Build the display/CSV row for a combination of value positions."""
+
+        combo = tuple(values[offset] for values, offset in zip(self._value_lists, offsets))
+        test_case = self._pattern.sub(lambda match: combo[self._positions[match.group(1)]], self._template)
+        return [f"CASO {index + 1}", *combo, test_case, "No" if is_invalid else "Sí", ""]
+
 
 def build_generacion_automatica_view(
     root: tk.Misc,
@@ -27,8 +227,11 @@ def build_generacion_automatica_view(
 
     ga_matrix_name = tk.StringVar(value="")
     ga_status = tk.StringVar(value="Listo.")
-    variables: list[dict[str, list[str] | str]] = []
-    preview_rows: list[list[str]] = []
+    variable_names: list[str] = []
+    variable_values: list[list[str]] = []
+    names_lower: set[str] = set()
+    variable_rows: list[tuple[tb.Frame, tb.Label, tb.Label]] = []
+    preview_matrix: _PreviewMatrix | None = None
 
     top = tb.Labelframe(parent, text="Datos de la matriz", padding=10)
     top.pack(fill=tk.X)
@@ -48,36 +251,55 @@ def build_generacion_automatica_view(
     ent_vals = tb.Entry(capture, textvariable=var_values, width=50)
     ent_vals.grid(row=1, column=1, sticky="we", padx=(0, 8), pady=(0, 8))
 
+    def build_variable_row(index: int) -> None:
+        """Append the widgets that display the variable at ``index``."""
+
+        row = tb.Frame(vars_box)
+        row.pack(fill=tk.X, pady=4)
+        name_label = tb.Label(row, text=variable_names[index], font=("Segoe UI", 10, "bold"))
+        name_label.pack(side=tk.LEFT)
+        tb.Label(row, text="  |  ").pack(side=tk.LEFT)
+        values_label = tb.Label(row, text=", ".join(variable_values[index]), bootstyle=SECONDARY)
+        values_label.pack(side=tk.LEFT)
+        tb.Button(row, text="✏️ Editar", bootstyle=SECONDARY, command=lambda: edit_var(row_position(row))).pack(
+            side=tk.RIGHT, padx=4
+        )
+        tb.Button(row, text="❌ Eliminar", bootstyle=DANGER, command=lambda: delete_var(row_position(row))).pack(
+            side=tk.RIGHT, padx=4
+        )
+        variable_rows.append((row, name_label, values_label))
+
+    def row_position(row: tb.Frame) -> int:
+        """Return the current index of a variable row, which shifts after deletions."""
+
+        return next(index for index, (frame, _, _) in enumerate(variable_rows) if frame is row)
+
+    def sync_empty_label() -> None:
+        """Show the placeholder only while there are no variables."""
+
+        if variable_names:
+            empty_label.pack_forget()
+        else:
+            empty_label.pack(anchor="w")
+
     def render_variables() -> None:
-        """Render the list of configured variables."""
+        """Render the list of configured variables from scratch."""
 
-        for widget in vars_box.winfo_children():
-            widget.destroy()
-        if not variables:
-            tb.Label(vars_box, text="(Sin variables)", bootstyle=SECONDARY).pack(anchor="w")
-            return
-        for index, var in enumerate(variables):
-            row = tb.Frame(vars_box)
-            row.pack(fill=tk.X, pady=4)
-            tb.Label(row, text=str(var["name"]), font=("Segoe UI", 10, "bold")).pack(side=tk.LEFT)
-            tb.Label(row, text="  |  ").pack(side=tk.LEFT)
-            tb.Label(row, text=", ".join(var["values"]), bootstyle=SECONDARY).pack(side=tk.LEFT)
-            tb.Button(row, text="✏️ Editar", bootstyle=SECONDARY, command=lambda idx=index: edit_var(idx)).pack(
-                side=tk.RIGHT, padx=4
-            )
-            tb.Button(row, text="❌ Eliminar", bootstyle=DANGER, command=lambda idx=index: delete_var(idx)).pack(
-                side=tk.RIGHT, padx=4
-            )
+        for frame, _, _ in variable_rows:
+            frame.destroy()
+        variable_rows.clear()
+        for index in range(len(variable_names)):
+            build_variable_row(index)
+        sync_empty_label()
 
     def edit_var(index: int) -> None:
         """Open a dialog to edit the selected variable."""
 
-        data = variables[index]
         dialog = tk.Toplevel(root)
-        dialog.title(f"Editar {data['name']}")
+        dialog.title(f"Editar {variable_names[index]}")
         dialog.geometry("420x200")
-        name_var = tk.StringVar(value=str(data["name"]))
-        values_var = tk.StringVar(value=", ".join(data["values"]))
+        name_var = tk.StringVar(value=variable_names[index])
+        values_var = tk.StringVar(value=", ".join(variable_values[index]))
         tb.Label(dialog, text="Variable").pack(anchor="w", padx=10, pady=(10, 2))
         tb.Entry(dialog, textvariable=name_var).pack(fill=tk.X, padx=10)
         tb.Label(dialog, text="Valores (coma)").pack(anchor="w", padx=10, pady=(10, 2))
@@ -91,14 +313,17 @@ def build_generacion_automatica_view(
             if not name or not values:
                 messagebox.showwarning("Faltan datos", "Nombre y valores no pueden quedar vacíos.")
                 return
-            if any(
-                idx != index and str(variables[idx]["name"]).lower() == name.lower()
-                for idx in range(len(variables))
-            ):
+            previous = variable_names[index].lower()
+            if name.lower() != previous and name.lower() in names_lower:
                 messagebox.showwarning("Duplicado", f"Ya existe una variable con nombre '{name}'.")
                 return
-            variables[index] = {"name": name, "values": values}
-            render_variables()
+            names_lower.discard(previous)
+            names_lower.add(name.lower())
+            variable_names[index] = name
+            variable_values[index] = values
+            _, name_label, values_label = variable_rows[index]
+            name_label.configure(text=name)
+            values_label.configure(text=", ".join(values))
             dialog.destroy()
 
         tb.Button(dialog, text="Guardar", bootstyle=PRIMARY, command=commit).pack(side=tk.RIGHT, padx=10, pady=12)
@@ -107,10 +332,12 @@ def build_generacion_automatica_view(
     def delete_var(index: int) -> None:
         """Remove a variable after confirming with the user."""
 
-        name = str(variables[index]["name"])
+        name = variable_names[index]
         if messagebox.askyesno("Confirmar", f"¿Eliminar variable '{name}'?"):
-            variables.pop(index)
-            render_variables()
+            names_lower.discard(variable_names.pop(index).lower())
+            variable_values.pop(index)
+            variable_rows.pop(index)[0].destroy()
+            sync_empty_label()
 
     def add_variable() -> None:
         """Append a variable to the working matrix definition."""
@@ -123,13 +350,16 @@ def build_generacion_automatica_view(
         if not values:
             messagebox.showwarning("Falta dato", "Debes capturar al menos un valor para la variable.")
             return
-        if any(str(item["name"]).lower() == name.lower() for item in variables):
+        if name.lower() in names_lower:
             messagebox.showwarning("Duplicado", f"La variable '{name}' ya existe.")
             return
-        variables.append({"name": name, "values": values})
+        names_lower.add(name.lower())
+        variable_names.append(name)
+        variable_values.append(values)
         var_name.set("")
         var_values.set("")
-        render_variables()
+        build_variable_row(len(variable_names) - 1)
+        sync_empty_label()
         ent_var.focus_set()
 
     tb.Button(capture, text="Agregar variable", bootstyle=PRIMARY, command=add_variable).grid(
@@ -140,6 +370,7 @@ def build_generacion_automatica_view(
 
     vars_box = tb.Frame(capture)
     vars_box.grid(row=2, column=0, columnspan=3, sticky="we")
+    empty_label = tb.Label(vars_box, text="(Sin variables)", bootstyle=SECONDARY)
     render_variables()
 
     template_box = tb.Labelframe(parent, text="Plantilla de caso de prueba", padding=10)
@@ -154,34 +385,9 @@ def build_generacion_automatica_view(
     def default_template() -> str:
         """Return the default test case template."""
 
-        if not variables:
+        if not variable_names:
             return "Validar el sistema"
-        parts = [f"{item['name']} es {{{item['name']}}}" for item in variables]
-        return "Validar el sistema cuando " + ", ".join(parts)
-
-    def parse_rules(text: str) -> list[dict[str, object]]:
-        """Parse the invalidation rules typed by the user."""
-
-        rules: list[dict[str, object]] = []
-        lines = [line.strip() for line in text.splitlines() if line.strip()]
-        for line in lines:
-            if "=>" not in line:
-                continue
-            conditions, result = [part.strip() for part in line.split("=>", 1)]
-            if not re.search(r"inv[aá]lido", result, flags=re.IGNORECASE):
-                continue
-            tokens = re.split(r"(&&|\|\|)", conditions)
-            terms = [token.strip() for token in tokens if token.strip()]
-            cond_terms: list[dict[str, str]] = []
-            operators: list[str] = []
-            for token in terms:
-                if token in ("&&", "||"):
-                    operators.append(token)
-                else:
-                    key, _, value = token.partition("=")
-                    cond_terms.append({"key": key.strip(), "val": value.strip()})
-            rules.append({"parts": cond_terms, "ops": operators})
-        return rules
+        return _default_template(tuple(variable_names))
 
     preview_box = tb.Labelframe(parent, text="Vista previa", padding=10)
     preview_box.pack(fill=tk.BOTH, expand=True, pady=(8, 0))
@@ -189,32 +395,47 @@ def build_generacion_automatica_view(
     buttons_row.pack(fill=tk.X)
 
     tree = ttk.Treeview(preview_box, show="headings", height=12)
-    vsb = ttk.Scrollbar(preview_box, orient="vertical", command=tree.yview)
-    tree.configure(yscrollcommand=vsb.set)
+    vsb = ttk.Scrollbar(preview_box, orient="vertical")
+
+    preview_window = VirtualTreeWindow(
+        tree,
+        vsb,
+        lambda: len(preview_matrix) if preview_matrix is not None else 0,
+        lambda index: preview_matrix.row(index),  # type: ignore[union-attr]
+        PREVIEW_WINDOW_SIZE,
+    )
 
     def clear_tree() -> None:
         """Reset the preview tree and remove all rows."""
 
-        for column in tree["columns"]:
-            try:
-                tree.heading(column, text="")
-            except Exception:
-                continue
-        tree.delete(*tree.get_children())
-        tree["columns"] = ()
+        children = tree.get_children("")
+        if not children and not tree["columns"]:
+            return
+        scroll_command = tree.cget("yscrollcommand")
+        tree.configure(yscrollcommand="")
+        try:
+            if children:
+                tree.delete(*children)
+            tree["columns"] = ()
+        finally:
+            tree.configure(yscrollcommand=scroll_command)
 
     def reset_form(confirm: bool = True) -> None:
         """Clear the current configuration and start over."""
 
-        has_data = bool(variables or tree.get_children(""))
+        nonlocal preview_matrix
+        has_data = bool(variable_names or tree.get_children(""))
         if confirm and has_data:
             if not messagebox.askyesno("Nueva matriz", "¿Limpiar la captura y comenzar otra matriz?"):
                 return
-        variables.clear()
+        variable_names.clear()
+        variable_values.clear()
+        names_lower.clear()
         render_variables()
         ga_matrix_name.set("")
         template_text.delete("1.0", "end")
         rules_text.delete("1.0", "end")
+        preview_matrix = None
         clear_tree()
         count_label.configure(text="")
         ga_status.set("Listo.")
@@ -223,80 +444,57 @@ def build_generacion_automatica_view(
         except Exception:
             pass
 
-    def evaluate_rules(rules: list[dict[str, object]], row_values: list[str], var_order: list[str]) -> bool:
-        """Return True when the given combination is invalid according to the rules."""
-
-        def term_value(term: dict[str, str]) -> bool:
-            """Check whether a single condition matches the provided row values."""
-
-            try:
-                index = var_order.index(term["key"])
-            except ValueError:
-                return False
-            return row_values[index] == term["val"]
-
-        for rule in rules:
-            value: bool | None = None
-            for idx, term in enumerate(rule["parts"]):
-                term_matches = term_value(term)  # type: ignore[arg-type]
-                if value is None:
-                    value = term_matches
-                else:
-                    operator = rule["ops"][idx - 1] if idx - 1 < len(rule["ops"]) else "&&"
-                    value = (value and term_matches) if operator == "&&" else (value or term_matches)
-            if value:
-                return True
-        return False
-
     def generate_preview() -> None:
         """Create the preview matrix using the captured variables."""
 
+        nonlocal preview_matrix
         missing: list[str] = []
         if not ga_matrix_name.get().strip():
             missing.append("Nombre de la matriz")
-        if not variables:
+        if not variable_names:
             missing.append("Al menos una variable")
         else:
-            for var in variables:
-                if not var["values"]:
-                    missing.append(f"Valores de {var['name']}")
+            for name, values in zip(variable_names, variable_values):
+                if not values:
+                    missing.append(f"Valores de {name}")
         if missing:
             messagebox.showwarning("Faltan datos", "Faltan: " + ", ".join(missing))
             return
 
-        var_names = [str(var["name"]) for var in variables]
+        var_names = list(variable_names)
         template = template_text.get("1.0", "end").strip() or default_template()
-        rules = parse_rules(rules_text.get("1.0", "end"))
-
-        combos = list(itertools.product(*[var["values"] for var in variables])) if variables else []
-        preview_rows.clear()
-        valid_count = 0
-        invalid_count = 0
-
-        for index, combo in enumerate(combos, start=1):
-            test_case = template
-            for name, value in zip(var_names, combo):
-                test_case = test_case.replace("{" + name + "}", str(value))
-            is_invalid = evaluate_rules(rules, list(combo), var_names)
-            is_valid_text = "No" if is_invalid else "Sí"
-            if is_invalid:
-                invalid_count += 1
+        # Value lists are replaced, never mutated, on edit, so a shallow snapshot is enough.
+        value_lists = list(variable_values)
+        compiled = _compile_rules(_parse_rules(rules_text.get("1.0", "end")), var_names, value_lists)
+        preview_matrix = _PreviewMatrix(var_names, value_lists, template, compiled)
+        total_count = len(preview_matrix)
+        invalid_count = preview_matrix.count_invalid()
+        valid_count = total_count - invalid_count
+
+        # Unmap the tree and detach the scrollbar while the tree is rebuilt so Tk lays it
+        # out and recomputes the scroll region once instead of per row.
+        tree.pack_forget()
+        tree.configure(yscrollcommand="")
+        try:
+            columns = ("NUMERO CASO DE PRUEBA", *var_names, "Caso de prueba", "¿Válido?", "PROCESAR")
+            if tuple(tree["columns"]) == columns:
+                tree.delete(*tree.get_children(""))
             else:
-                valid_count += 1
-            row = [f"CASO {index}", *combo, test_case, is_valid_text, ""]
-            preview_rows.append(row)
-
-        clear_tree()
-        columns = ["NUMERO CASO DE PRUEBA", *var_names, "Caso de prueba", "¿Válido?", "PROCESAR"]
-        tree["columns"] = columns
-        for column in columns:
-            tree.heading(column, text=column)
-            tree.column(column, width=160, anchor="w")
-        for row in preview_rows:
-            tree.insert("", "end", values=row)
+                clear_tree()
+                tree["columns"] = columns
+                for column in columns:
+                    tree.heading(column, text=column)
+                    tree.column(column, width=160, anchor="w")
+            preview_window.render(0)
+        finally:
+            tree.configure(yscrollcommand=preview_window.on_tree_scroll)
+            tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, before=vsb)
+        tree.update_idletasks()
+        tree.yview_moveto(0)
+        preview_window.on_tree_scroll(*tree.yview())
 
         count_label.configure(
-            text=f"Total: {len(preview_rows)}  •  Válidos: {valid_count}  •  Inválidos: {invalid_count}"
+            text=f"Total: {total_count}  •  Válidos: {valid_count}  •  Inválidos: {invalid_count}"
         )
         ga_status.set("Vista previa generada.")
 
@@ -306,7 +504,7 @@ def build_generacion_automatica_view(
 
     tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
     vsb.pack(side=tk.RIGHT, fill=tk.Y)
-    bind_mousewheel(tree, tree.yview)
+    bind_mousewheel(tree, preview_window.scroll)
 
     toolbar = tb.Frame(parent)
     toolbar.pack(fill=tk.X, pady=(8, 0))
@@ -314,34 +512,59 @@ def build_generacion_automatica_view(
     def sanitize_filename(name: str) -> str:
         """Return a safe filename derived from the provided name."""
 
-        return re.sub(r'[\\/:*?"<>|]+', "_", name.strip())
+        cleaned = name.strip().translate(INVALID_FILENAME_TABLE)
+        while "__" in cleaned:
+            cleaned = cleaned.replace("__", "_")
+        return cleaned
 
     def save_csv() -> None:
         """Persist the preview to a CSV file within the templates directory."""
 
-        rows = [tree.item(child, "values") for child in tree.get_children("")]
-        if not rows:
+        matrix = preview_matrix
+        if matrix is None:
             messagebox.showwarning("Sin datos", "Primero genera la vista previa.")
             return
         base = os.path.dirname(os.path.abspath(__file__))
         target_dir = os.path.join(base, "template_matrices")
-        os.makedirs(target_dir, exist_ok=True)
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"{sanitize_filename(ga_matrix_name.get())}_{timestamp}.csv"
         path = os.path.join(target_dir, filename)
         columns = tree["columns"]
-        try:
-            with open(path, "w", newline="", encoding="utf-8") as handler:
-                writer = csv.writer(handler)
-                writer.writerow(columns)
-                writer.writerows(rows)
+
+        def write() -> None:
+            """Write the matrix off the Tk thread and report back through ``after``."""
+
+            try:
+                os.makedirs(target_dir, exist_ok=True)
+                with open(path, "w", newline="", encoding="utf-8", buffering=CSV_WRITE_BUFFER_SIZE) as handler:
+                    writer = csv.writer(handler)
+                    writer.writerow(columns)
+                    writer.writerows(matrix)
+            except Exception as exc:  # pragma: no cover - Tkinter handles GUI feedback
+                error = exc
+                root.after(0, lambda: finish(error))
+            else:
+                root.after(0, lambda: finish(None))
+
+        def finish(error: Exception | None) -> None:
+            """Re-enable the button and tell the user how the export went."""
+
+            if not save_button.winfo_exists():
+                return
+            save_button.configure(state=tk.NORMAL)
+            if error is not None:
+                ga_status.set("ERROR al guardar CSV")
+                messagebox.showerror("Error", f"No se pudo guardar el CSV:\n{error}")
+                return
             ga_status.set(f"Guardado: {path}")
             messagebox.showinfo("Éxito", f"Matriz guardada en:\n{path}")
-        except Exception as exc:  # pragma: no cover - Tkinter handles GUI feedback
-            ga_status.set("ERROR al guardar CSV")
-            messagebox.showerror("Error", f"No se pudo guardar el CSV:\n{exc}")
 
-    tb.Button(toolbar, text="Descargar CSV", bootstyle=PRIMARY, command=save_csv).pack(side=tk.LEFT)
+        save_button.configure(state=tk.DISABLED)
+        ga_status.set("Guardando CSV...")
+        threading.Thread(target=write, daemon=True).start()
+
+    save_button = tb.Button(toolbar, text="Descargar CSV", bootstyle=PRIMARY, command=save_csv)
+    save_button.pack(side=tk.LEFT)
     tb.Button(
         toolbar,
         text="Generar otra matriz",
@@ -2,17 +2,106 @@
 
 from __future__ import annotations
 
+import codecs
 import csv
 import datetime
 import os
 import re
-from typing import Callable
+from collections import Counter
+from functools import lru_cache
+from itertools import islice
+from typing import Callable, Iterator
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 
 import ttkbootstrap as tb
 from ttkbootstrap.constants import *  # noqa: F401,F403
 
+from app.views.virtual_tree import VirtualTreeWindow
+
+
+HEADER_ACCENT_TABLE = str.maketrans("áéíóúñ", "aeioun", "¿?")
+WHITESPACE_PATTERN = re.compile(r'\s+')
+INVALID_FILENAME_PATTERN = re.compile(r'[\\/:*?"<>|]+')
+CSV_SAMPLE_SIZE = 1 << 16
+CSV_DELIMITERS = ",;\t"
+CSV_WRITE_BUFFER_SIZE = 1 << 20
+IMPORT_CHUNK_SIZE = 2000
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "template_matrices")
+CSV_BOM_ENCODINGS = ((codecs.BOM_UTF8, "utf-8-sig"), (codecs.BOM_UTF16_LE, "utf-16"), (codecs.BOM_UTF16_BE, "utf-16"))
+CSV_FALLBACK_ENCODINGS = ("utf-8", "cp1252", "latin-1")
+# Configura encabezado y columna de todas las columnas en una sola llamada al intérprete Tcl.
+TREE_COLUMNS_SCRIPT = "{w cols} {foreach c $cols {$w heading $c -text $c; $w column $c -width 160 -anchor w}}"
+
+
+@lru_cache(maxsize=512)
+def _normalize_header(s: str) -> str:
+    """Return the header lowercased, without accents or question marks and with single spaces."""
+    s = (s or "").strip().lower().translate(HEADER_ACCENT_TABLE)
+    s = WHITESPACE_PATTERN.sub(' ', s)
+    return s
+
+
+def _detect_csv_encoding(sample: bytes) -> tuple[tuple[str, ...], str]:
+    """Return the encodings to try, starting with the first that decodes the sample, and the decoded sample.
+
+    A BOM fixes the encoding; otherwise UTF-8, cp1252 and latin-1 stay available as fallbacks
+    for bytes that only show up after the sample.
+    """
+    encodings = CSV_FALLBACK_ENCODINGS
+    for bom, enc in CSV_BOM_ENCODINGS:
+        if sample.startswith(bom):
+            encodings = (enc,)
+            break
+    for i, candidate in enumerate(encodings):
+        try:
+            text = codecs.getincrementaldecoder(candidate)().decode(sample, final=False)
+        except UnicodeDecodeError:
+            continue
+        return encodings[i:], text
+    raise ValueError("No se pudo detectar la codificación del CSV.")
+
+
+def _ensure_template_dir() -> str:
+    """Create the output folder if it is missing (it may be removed between saves) and return it."""
+    os.makedirs(TEMPLATE_DIR, exist_ok=True)
+    return TEMPLATE_DIR
+
+
+@lru_cache(maxsize=1)
+def _get_openpyxl():
+    """Import openpyxl on first use and cache the module (or None when it is not installed)."""
+    try:
+        import openpyxl
+    except ImportError:
+        return None
+    return openpyxl
+
+
+def _iter_csv_rows(path: str) -> Iterator[list[str]]:
+    """Yield the header row and then each data row of a CSV, reading the file lazily.
+
+    If a byte past the sample does not decode, the file is reopened with the next candidate
+    encoding and the rows already yielded are skipped.
+    """
+    with open(path, "rb") as raw:
+        sample = raw.read(CSV_SAMPLE_SIZE)
+    encodings, text = _detect_csv_encoding(sample)
+    # Una sola pasada sobre la muestra; en empate (o sin separadores) gana la coma.
+    counts = Counter(ch for ch in text[:4096] if ch in CSV_DELIMITERS)
+    delim = max(CSV_DELIMITERS, key=counts.__getitem__)
+    emitted = 0
+    for enc in encodings:
+        try:
+            with open(path, "r", encoding=enc, newline="") as f:
+                for row in islice(csv.reader(f, delimiter=delim), emitted, None):
+                    yield row
+                    emitted += 1
+            return
+        except UnicodeDecodeError:
+            if enc == encodings[-1]:
+                raise
+
 
 def build_generacion_manual_view(
     root: tk.Misc,
@@ -29,79 +118,80 @@ def build_generacion_manual_view(
     gm_status = tk.StringVar(value="Elige cómo quieres trabajar (importar o captura manual).")
     gm_case_counter = tk.IntVar(value=1)
     gm_dyncols = []
+    imp_rows: list[list[str]] = []
+    man_values: dict[str, list[str]] = {}
     
     def _sanitize_filename(name: str) -> str:
         """Auto-generated docstring for `_sanitize_filename`."""
-        name = re.sub(r'[\\/:*?"<>|]+', "_", name.strip()); return name
-    
-    def _normalize_header(s: str) -> str:
-        """Auto-generated docstring for `_normalize_header`."""
-        s = (s or "").strip().lower()
-        for a,b in {"á":"a","é":"e","í":"i","ó":"o","ú":"u","ñ":"n","¿":"", "?":""}.items():
-            s = s.replace(a,b)
-        s = re.sub(r'\s+', ' ', s)
-        return s
+        name = INVALID_FILENAME_PATTERN.sub("_", name.strip()); return name
     
     REQ_LEFT  = "numero caso de prueba"
     REQ_RIGHT = "caso de prueba"
     REQ_FIXED_TAIL = ["¿válido?", "procesar"]
     
+    REQ_FIXED_TAIL_NORM = [_normalize_header(h) for h in REQ_FIXED_TAIL]
+    
+    def _normalize_and_index(headers):
+        """Normalize the headers once and map each normalized name to its first position."""
+        norm = [_normalize_header(h) for h in headers]; pos = {}
+        for i, h in enumerate(norm): pos.setdefault(h, i)
+        return norm, pos
+    
     def _headers_ok(headers):
         """Auto-generated docstring for `_headers_ok`."""
-        norm = [_normalize_header(h) for h in headers]
-        fixed_norm = [_normalize_header(h) for h in REQ_FIXED_TAIL]
-        if REQ_LEFT not in norm: return False, "Falta columna 'NUMERO CASO DE PRUEBA'"
-        if REQ_RIGHT not in norm: return False, "Falta columna 'Caso de prueba'"
-        miss = [REQ_FIXED_TAIL[i] for i,h in enumerate(fixed_norm) if h not in norm]
+        _, pos = _normalize_and_index(headers)
+        if REQ_LEFT not in pos: return False, "Falta columna 'NUMERO CASO DE PRUEBA'"
+        if REQ_RIGHT not in pos: return False, "Falta columna 'Caso de prueba'"
+        miss = [REQ_FIXED_TAIL[i] for i,h in enumerate(REQ_FIXED_TAIL_NORM) if h not in pos]
         if miss: return False, f"Faltan columnas: {', '.join(miss)}"
-        if norm.index(REQ_LEFT) >= norm.index(REQ_RIGHT):
+        if pos[REQ_LEFT] >= pos[REQ_RIGHT]:
             return False, "'NUMERO CASO DE PRUEBA' debe ir antes que 'Caso de prueba'"
         return True, ""
     
     def _split_headers(headers):
         """Auto-generated docstring for `_split_headers`."""
-        norm = [_normalize_header(h) for h in headers]
-        li = norm.index(REQ_LEFT); ri = norm.index(REQ_RIGHT)
+        _, pos = _normalize_and_index(headers)
+        li = pos[REQ_LEFT]; ri = pos[REQ_RIGHT]
         left = [headers[li]]; dyn = headers[li+1:ri]; tail = headers[ri:]
         return left, dyn, tail
     
     def _tree_set_columns(tree, headers):
         """Auto-generated docstring for `_tree_set_columns`."""
         tree['columns'] = headers
+        try: tree.tk.call("apply", TREE_COLUMNS_SCRIPT, str(tree), tuple(headers)); return
+        except tk.TclError: pass
         for c in headers:
             try: tree.heading(c, text=c); tree.column(c, width=160, anchor="w")
             except Exception: pass
     
+    renumber_jobs = {}
+    
     def _renumber_cases(tree):
         """Auto-generated docstring for `_renumber_cases`."""
+        job = renumber_jobs.pop(str(tree), None)
+        if job is not None:
+            try: tree.after_cancel(job)
+            except Exception: pass
         cols = list(tree['columns'])
-        norm = [_normalize_header(h) for h in cols]
-        if REQ_LEFT not in norm: return
-        idx = norm.index(REQ_LEFT)
+        idx = _normalize_and_index(cols)[1].get(REQ_LEFT)
+        if idx is None: return
+        col = cols[idx]
+        cache = man_values if tree is man_tree else None
         for i, item in enumerate(tree.get_children(""), start=1):
-            vals = list(tree.item(item, 'values'))
-            if idx < len(vals):
-                vals[idx] = f"CASO {i}"
-                tree.item(item, values=vals)
-    
-    def _read_csv_any_encoding(path):
-        """Auto-generated docstring for `_read_csv_any_encoding`."""
-        encs = ["utf-8-sig", "utf-8", "cp1252", "latin-1"]
-        last_err = None
-        for enc in encs:
-            try:
-                with open(path, "r", encoding=enc, newline="") as f:
-                    sample = f.read(4096); f.seek(0)
-                    delim = ","
-                    if sample.count(";") > sample.count(",") and ";" in sample: delim = ";"
-                    elif "\t" in sample and sample.count("\t") > 0: delim = "\t"
-                    reader = csv.reader(f, delimiter=delim)
-                    headers = next(reader, [])
-                    rows = list(reader)
-                    return headers, rows
-            except Exception as ex:
-                last_err = ex; continue
-        raise last_err if last_err else Exception("No se pudo leer el CSV.")
+            tree.set(item, col, f"CASO {i}")
+            if cache is not None and item in cache: cache[item][idx] = f"CASO {i}"
+    
+    def _schedule_renumber(tree):
+        """Coalesce renumbering requests for a tree into a single pass on the next idle cycle."""
+        if str(tree) in renumber_jobs: return
+        renumber_jobs[str(tree)] = tree.after_idle(lambda: _renumber_cases(tree))
+    
+    def _renumber_rows(rows, headers):
+        """Rewrite the case number column of the imported rows kept in memory."""
+        idx = _normalize_and_index(headers)[1].get(REQ_LEFT)
+        if idx is None: return
+        for i, r in enumerate(rows, start=1):
+            if idx < len(r): r[idx] = f"CASO {i}"
     
     # Selector de modo
     mode_box = tb.Labelframe(parent, text="¿Cómo deseas trabajar?", padding=10); mode_box.pack(fill=X)
@@ -129,18 +219,20 @@ def build_generacion_manual_view(
     
     def _save_from_tree(tree):
         """Auto-generated docstring for `_save_from_tree`."""
-        rows = [tree.item(ch, 'values') for ch in tree.get_children("")]
+        if tree is imp_tree and "rows" in import_job:
+            messagebox.showwarning("Carga en curso", "Espera a que termine la importación o cancélala antes de guardar."); return
+        if str(tree) in renumber_jobs: _renumber_cases(tree)
+        rows = imp_rows if tree is imp_tree else list(man_values.values())
         if not rows:
             messagebox.showwarning("Sin datos", "No hay filas para guardar."); return
         if not gm_matrix_name.get().strip():
             messagebox.showwarning("Falta nombre", "Captura el nombre de la matriz."); return
-        base = os.path.dirname(os.path.abspath(__file__)); target_dir = os.path.join(base, "template_matrices"); os.makedirs(target_dir, exist_ok=True)
+        target_dir = _ensure_template_dir()
         dt = datetime.datetime.now().strftime("%Y%m%d_%H%M%S"); fname = f"{_sanitize_filename(gm_matrix_name.get())}_{dt}.csv"
         fpath = os.path.join(target_dir, fname)
         try:
-            with open(fpath, "w", newline="", encoding="utf-8") as f:
-                w = csv.writer(f); w.writerow(tree['columns'])
-                for r in rows: w.writerow(r)
+            with open(fpath, "w", newline="", encoding="utf-8", buffering=CSV_WRITE_BUFFER_SIZE) as f:
+                w = csv.writer(f); w.writerow(tree['columns']); w.writerows(rows)
             gm_status.set(f"Guardado: {fpath}"); messagebox.showinfo("Éxito", f"Matriz guardada en:\n{fpath}")
         except Exception as ex:
             messagebox.showerror("Error", f"No se pudo guardar el CSV:\n{ex}")
@@ -156,12 +248,13 @@ def build_generacion_manual_view(
     def _gm_reset_form(confirm=True):
         """Auto-generated docstring for `_gm_reset_form`."""
         has_rows = False
-        try: has_rows = bool(imp_tree.get_children("") or man_tree.get_children(""))
+        try: has_rows = bool(imp_rows or man_values)
         except Exception: pass
         has_dyn = bool(gm_dyncols); has_name = bool(gm_matrix_name.get().strip())
         if confirm and (has_rows or has_dyn or has_name):
             if not messagebox.askyesno("Nueva matriz", "¿Limpiar todo para comenzar una nueva matriz?"): return
         gm_matrix_name.set(""); gm_case_counter.set(1); gm_dyncols.clear()
+        _finish_import(); imp_rows.clear(); man_values.clear()
         try: _gm_clear_tree(imp_tree); _gm_clear_tree(man_tree)
         except Exception: pass
         gm_status.set("Elige cómo quieres trabajar (importar o captura manual).")
@@ -180,9 +273,11 @@ def build_generacion_manual_view(
     imp_prev = tb.Labelframe(import_frame, text="Vista previa (importado)", padding=10)
     imp_tv_wrap = tb.Frame(imp_prev)
     imp_tree = ttk.Treeview(imp_tv_wrap, show="headings", height=10)
-    imp_vsb = ttk.Scrollbar(imp_tv_wrap, orient="vertical", command=imp_tree.yview); imp_tree.configure(yscrollcommand=imp_vsb.set)
+    imp_vsb = ttk.Scrollbar(imp_tv_wrap, orient="vertical")
+    # Solo se insertan en el Treeview las filas de la ventana visible; el resto vive en imp_rows.
+    imp_window = VirtualTreeWindow(imp_tree, imp_vsb, lambda: len(imp_rows), lambda i: imp_rows[i])
     imp_tree.pack(side=LEFT, fill=BOTH, expand=True); imp_vsb.pack(side=RIGHT, fill=Y)
-    bind_mousewheel(imp_tree, imp_tree.yview)
+    bind_mousewheel(imp_tree, imp_window.scroll)
     imp_actions = tb.Frame(import_frame)
     
     def _imp_delete_selected():
@@ -190,19 +285,36 @@ def build_generacion_manual_view(
         sel = imp_tree.selection()
         if not sel: return
         if not messagebox.askyesno("Eliminar", f"¿Eliminar {len(sel)} fila(s) seleccionada(s)?"): return
-        for it in sel: imp_tree.delete(it)
-        _renumber_cases(imp_tree); gm_status.set("Fila(s) eliminada(s).")
+        for i in sorted((imp_window.index_of(it) for it in sel), reverse=True): del imp_rows[i]
+        _renumber_rows(imp_rows, imp_tree['columns']); imp_window.render(); gm_status.set("Fila(s) eliminada(s).")
     
     def _imp_clear_all():
         """Auto-generated docstring for `_imp_clear_all`."""
-        if not imp_tree.get_children(""): return
+        if not imp_rows: return
         if not messagebox.askyesno("Vaciar tabla", "¿Vaciar todas las filas importadas?"): return
-        imp_tree.delete(*imp_tree.get_children()); gm_status.set("Tabla vacía.")
+        _finish_import(); imp_rows.clear(); imp_window.render(0); gm_status.set("Tabla vacía.")
+    
+    import_job = {}
+    
+    def _finish_import():
+        """Stop a chunked import in progress, closing its file and hiding the cancel button."""
+        rows_iter = import_job.pop("rows", None); job = import_job.pop("job", None)
+        if job is not None:
+            try: root.after_cancel(job)
+            except Exception: pass
+        if rows_iter is not None: rows_iter.close()
+        imp_cancel_btn.pack_forget()
+    
+    def _cancel_import():
+        """Abort the import in progress and discard the rows loaded so far."""
+        if "rows" not in import_job: return
+        _finish_import(); imp_rows.clear(); imp_window.render(0); gm_status.set("Carga cancelada.")
     
     imp_tree.bind("<Delete>", lambda e: (_imp_delete_selected(), "break"))
     
     tb.Button(imp_actions, text="Eliminar fila", bootstyle=DANGER, command=_imp_delete_selected).pack(side=LEFT)
     tb.Button(imp_actions, text="Vaciar tabla", bootstyle=SECONDARY, command=_imp_clear_all).pack(side=LEFT, padx=(8,0))
+    imp_cancel_btn = tb.Button(imp_actions, text="Cancelar", bootstyle=WARNING, command=_cancel_import)
     
     # --- Manual ---
     cols_bar = tb.Labelframe(manual_frame, text="Columnas dinámicas", padding=10)
@@ -214,40 +326,47 @@ def build_generacion_manual_view(
         if not name: return
         if name in gm_dyncols: messagebox.showwarning("Duplicado", f"La columna '{name}' ya existe."); return
         gm_dyncols.append(name); _gm_newcol.set("")
-        _man_build_tree_headers(); _rebuild_manual_inputs(); _render_dynchips()
+        _man_build_tree_headers(); _sync_dyncol_rows(); _render_dynchips()
     tb.Button(cols_bar, text="Agregar columna", bootstyle=SECONDARY, command=_add_dyncol_and_refresh).pack(side=LEFT, padx=(8,0))
     tb.Button(cols_bar, text="Cargar desde plantilla (CSV)", bootstyle=SECONDARY, command=lambda: _load_dyncols_from_template()).pack(side=LEFT, padx=(8,0))
     
     chips_holder = tb.Frame(cols_bar); chips_holder.pack(fill=X, pady=(8,0))
     
+    _chip_widgets = {}
+    chips_empty = tb.Label(chips_holder, text="(Sin columnas dinámicas)", bootstyle=SECONDARY)
+    
     def _render_dynchips():
-        """Auto-generated docstring for `_render_dynchips`."""
-        for w in chips_holder.winfo_children(): w.destroy()
+        """Create/destroy only the chips of added/removed columns and repack when the order changed."""
+        wanted = set(gm_dyncols)
+        for name in [c for c in _chip_widgets if c not in wanted]: _chip_widgets.pop(name).destroy()
         if not gm_dyncols:
-            tb.Label(chips_holder, text="(Sin columnas dinámicas)", bootstyle=SECONDARY).pack(anchor="w"); return
-        for i, col in enumerate(gm_dyncols):
+            chips_empty.pack(anchor="w"); return
+        chips_empty.pack_forget()
+        for col in gm_dyncols:
+            if col in _chip_widgets: continue
             chip = tb.Frame(chips_holder, bootstyle=SECONDARY); chip.pack(side=LEFT, padx=4)
             tb.Label(chip, text=col).pack(side=LEFT, padx=(6,2), pady=2)
             def _make_cmd(name=col):
                 """Auto-generated docstring for `_make_cmd`."""
                 def _cmd():
                     """Auto-generated docstring for `_cmd`."""
-                    if man_tree.get_children(""):
+                    if man_values:
                         if not messagebox.askyesno("Eliminar columna", f"Hay filas capturadas.\n¿Eliminar la columna '{name}' y ajustar la tabla?"): return
                     old = list(gm_dyncols); new_dyn = [c for c in old if c != name]
-                    rows = [man_tree.item(ch, 'values') for ch in man_tree.get_children("")]
                     gm_dyncols.clear(); gm_dyncols.extend(new_dyn)
-                    _man_build_tree_headers()
-                    if rows:
-                        man_tree.delete(*man_tree.get_children(""))
-                        old_dyn_len = len(old)
-                        for vals in rows:
-                            base = [vals[0]]; old_dyn_vals = list(vals[1:1+old_dyn_len]); rest = list(vals[1+old_dyn_len:])
-                            mapped = [old_dyn_vals[old.index(c)] for c in new_dyn]
-                            man_tree.insert("", "end", values=base+mapped+rest)
-                    _rebuild_manual_inputs(); _render_dynchips()
+                    # Se conservan las filas (y sus iids) y solo se quita el valor de la columna eliminada.
+                    drop = 1 + old.index(name)
+                    _tree_set_columns(man_tree, ["NUMERO CASO DE PRUEBA", *new_dyn, "Caso de prueba", "¿Válido?", "PROCESAR"])
+                    for item, vals in man_values.items():
+                        new_vals = vals[:drop] + vals[drop+1:]
+                        man_tree.item(item, values=new_vals); man_values[item] = new_vals
+                    _sync_dyncol_rows(); _render_dynchips()
                 return _cmd
             tb.Button(chip, text="✕", bootstyle=DANGER, width=2, command=_make_cmd()).pack(side=LEFT, padx=(2,6), pady=2)
+            _chip_widgets[col] = chip
+        if list(_chip_widgets) != gm_dyncols:
+            for col in gm_dyncols: _chip_widgets[col].pack_forget()
+            for col in gm_dyncols: _chip_widgets[col].pack(side=LEFT, padx=4); _chip_widgets[col] = _chip_widgets.pop(col)
     
     man_cap = tb.Labelframe(manual_frame, text="Captura de filas", padding=10)
     scroll_wrap = tb.Frame(man_cap)
@@ -257,17 +376,19 @@ def build_generacion_manual_view(
     bind_mousewheel(canvas, canvas.yview)
     
     inner = tb.Frame(canvas); inner_id = canvas.create_window((0,0), window=inner, anchor="nw")
-    def _on_inner_config(event):
-        """Auto-generated docstring for `_on_inner_config`."""
+    canvas_layout = {"job": None}
+    def _apply_canvas_layout():
+        """Recompute the scroll region and inner width once per idle cycle."""
+        canvas_layout["job"] = None
         canvas.configure(scrollregion=canvas.bbox("all"))
         try: canvas.itemconfig(inner_id, width=canvas.winfo_width())
         except Exception: pass
-    inner.bind("<Configure>", _on_inner_config)
-    def _on_canvas_config(event):
-        """Auto-generated docstring for `_on_canvas_config`."""
-        try: canvas.itemconfig(inner_id, width=event.width)
-        except Exception: pass
-    canvas.bind("<Configure>", _on_canvas_config)
+    def _schedule_canvas_layout(event=None):
+        """Coalesce bursts of <Configure> events into a single layout pass."""
+        if canvas_layout["job"] is None:
+            canvas_layout["job"] = canvas.after_idle(_apply_canvas_layout)
+    inner.bind("<Configure>", _schedule_canvas_layout)
+    canvas.bind("<Configure>", _schedule_canvas_layout)
     
     btns = tb.Frame(man_cap)
     
@@ -279,63 +400,84 @@ def build_generacion_manual_view(
     bind_mousewheel(man_tree, man_tree.yview)
     man_actions = tb.Frame(manual_frame)
     
+    def _man_insert(values):
+        """Insert a manual row and keep its values cached to avoid reading them back from Tk."""
+        item = man_tree.insert("", "end", values=values); man_values[item] = list(values)
+        return item
+    
+    def _man_clear_rows():
+        """Remove every manual row from the tree and the cache."""
+        man_tree.delete(*man_tree.get_children()); man_values.clear()
+    
     def _man_build_tree_headers():
         """Auto-generated docstring for `_man_build_tree_headers`."""
         headers = ["NUMERO CASO DE PRUEBA", *gm_dyncols, "Caso de prueba", "¿Válido?", "PROCESAR"]
-        man_tree.delete(*man_tree.get_children()); _tree_set_columns(man_tree, headers)
+        _man_clear_rows(); _tree_set_columns(man_tree, headers)
     
-    def _rebuild_manual_inputs():
-        """Auto-generated docstring for `_rebuild_manual_inputs`."""
-        for w in inner.winfo_children(): w.destroy()
-        row = 0
-        tb.Label(inner, text="NUMERO CASO DE PRUEBA").grid(row=row, column=0, sticky="w", padx=(0,8), pady=4)
+    _dyn_widgets = {}
+    _static_rows = []
+    manual_inputs = {}
+    
+    def _build_manual_inputs_once():
+        """Create the fixed capture widgets; dynamic rows are handled by `_sync_dyncol_rows`."""
+        tb.Label(inner, text="NUMERO CASO DE PRUEBA").grid(row=0, column=0, sticky="w", padx=(0,8), pady=4)
         case_no_var = tk.StringVar(value=f"CASO {gm_case_counter.get()}")
-        tb.Label(inner, textvariable=case_no_var).grid(row=row, column=1, sticky="w")
-        tb.Label(inner, text="Siguiente #").grid(row=row, column=2, sticky="e", padx=(12,4))
+        tb.Label(inner, textvariable=case_no_var).grid(row=0, column=1, sticky="w")
+        tb.Label(inner, text="Siguiente #").grid(row=0, column=2, sticky="e", padx=(12,4))
         try: sb = ttk.Spinbox(inner, from_=1, to=1000000, textvariable=gm_case_counter, width=8)
         except Exception: sb = tk.Spinbox(inner, from_=1, to=1000000, textvariable=gm_case_counter, width=8)
-        sb.grid(row=row, column=3, sticky="w")
+        sb.grid(row=0, column=3, sticky="w")
         # Botón superior agregar fila (visible)
         def _add_row():
             """Auto-generated docstring for `_add_row`."""
-            missing = [c for c in gm_dyncols if not col_vars[c].get().strip()]
+            missing = [c for c in gm_dyncols if not _dyn_widgets[c][2].get().strip()]
             if not case_txt.get().strip(): missing.append("Caso de prueba")
             if missing: messagebox.showwarning("Faltan datos", "Completa: " + ", ".join(missing)); return
             case_no = f"CASO {gm_case_counter.get()}"; gm_case_counter.set(gm_case_counter.get()+1)
-            row_vals = [case_no] + [col_vars[c].get().strip() for c in gm_dyncols] + [case_txt.get().strip(), valid_var.get(), proc_var.get().strip()]
-            man_tree.insert("", "end", values=row_vals); gm_status.set(f"Fila agregada ({case_no})")
+            row_vals = [case_no] + [_dyn_widgets[c][2].get().strip() for c in gm_dyncols] + [case_txt.get().strip(), valid_var.get(), proc_var.get().strip()]
+            _man_insert(row_vals); gm_status.set(f"Fila agregada ({case_no})")
             case_no_var.set(f"CASO {gm_case_counter.get()}"); case_txt.set(""); proc_var.set(""); val_combo.set("Sí")
-            _renumber_cases(man_tree)
-        tb.Button(inner, text="Agregar fila", bootstyle=PRIMARY, command=_add_row).grid(row=row, column=4, sticky="w", padx=(12,0))
-        row += 1
-    
-        col_vars = {}
-        for c in gm_dyncols:
-            tb.Label(inner, text=c).grid(row=row, column=0, sticky="w", padx=(0,8), pady=4)
-            v = tk.StringVar(value=""); col_vars[c] = v
-            tb.Entry(inner, textvariable=v).grid(row=row, column=1, sticky="we", padx=(0,8), pady=4)
-            row += 1
+            _schedule_renumber(man_tree)
+        tb.Button(inner, text="Agregar fila", bootstyle=PRIMARY, command=_add_row).grid(row=0, column=4, sticky="w", padx=(12,0))
         inner.grid_columnconfigure(1, weight=1)
     
-        tb.Label(inner, text="Caso de prueba").grid(row=row, column=0, sticky="w", padx=(0,8), pady=4)
-        case_txt = tk.StringVar(value=""); tb.Entry(inner, textvariable=case_txt).grid(row=row, column=1, sticky="we", pady=4); row += 1
-    
-        tb.Label(inner, text="¿Válido?").grid(row=row, column=0, sticky="w", padx=(0,8), pady=4)
+        # Filas fijas bajo las dinámicas; solo se recolocan cuando cambia el número de columnas.
+        case_txt = tk.StringVar(value="")
+        _static_rows.append((tb.Label(inner, text="Caso de prueba"), tb.Entry(inner, textvariable=case_txt), dict(sticky="we")))
         valid_var = tk.StringVar(value="Sí"); val_combo = ttk.Combobox(inner, textvariable=valid_var, values=["Sí","No"], state="readonly", width=10)
-        val_combo.grid(row=row, column=1, sticky="w", pady=4); row += 1
-    
-        tb.Label(inner, text="PROCESAR").grid(row=row, column=0, sticky="w", padx=(0,8), pady=4)
-        proc_var = tk.StringVar(value=""); tb.Entry(inner, textvariable=proc_var, width=10).grid(row=row, column=1, sticky="w", pady=4); row += 1
+        _static_rows.append((tb.Label(inner, text="¿Válido?"), val_combo, dict(sticky="w")))
+        proc_var = tk.StringVar(value="")
+        _static_rows.append((tb.Label(inner, text="PROCESAR"), tb.Entry(inner, textvariable=proc_var, width=10), dict(sticky="w")))
     
-        for w in btns.winfo_children(): w.destroy()
         def _clear_inputs():
             """Auto-generated docstring for `_clear_inputs`."""
-            for c in gm_dyncols:
-                try: col_vars[c].set("")
-                except Exception: pass
+            for _, _, v in _dyn_widgets.values(): v.set("")
             case_txt.set(""); val_combo.set("Sí"); proc_var.set("")
         tb.Button(btns, text="Agregar fila", bootstyle=PRIMARY, command=_add_row).pack(side=LEFT)
         tb.Button(btns, text="Limpiar entradas", bootstyle=SECONDARY, command=_clear_inputs).pack(side=LEFT, padx=(8,0))
+        manual_inputs["case_no_var"] = case_no_var
+    
+    def _sync_dyncol_rows():
+        """Add/remove only the entry rows of changed dynamic columns and regrid the rest."""
+        wanted = set(gm_dyncols)
+        for name in [n for n in _dyn_widgets if n not in wanted]:
+            lbl, ent, _ = _dyn_widgets.pop(name); lbl.destroy(); ent.destroy()
+        row = 1
+        for c in gm_dyncols:
+            if c not in _dyn_widgets:
+                v = tk.StringVar(value="")
+                _dyn_widgets[c] = (tb.Label(inner, text=c), tb.Entry(inner, textvariable=v), v)
+            lbl, ent, _ = _dyn_widgets[c]
+            lbl.grid(row=row, column=0, sticky="w", padx=(0,8), pady=4)
+            ent.grid(row=row, column=1, sticky="we", padx=(0,8), pady=4)
+            row += 1
+        for lbl, widget, opts in _static_rows:
+            lbl.grid(row=row, column=0, sticky="w", padx=(0,8), pady=4)
+            widget.grid(row=row, column=1, pady=4, **opts)
+            row += 1
+        manual_inputs["case_no_var"].set(f"CASO {gm_case_counter.get()}")
+    
+    _build_manual_inputs_once()
     
     def _browse_import():
         """Auto-generated docstring for `_browse_import`."""
@@ -343,73 +485,133 @@ def build_generacion_manual_view(
         if not path: return
         imp_path.set(path); _load_import(path)
     
+    def _iter_import_rows(path, ext):
+        """Yield the header row and then each data row of a CSV/XLSX file without buffering the sheet."""
+        if ext == ".csv":
+            yield from _iter_csv_rows(path); return
+        wb = _get_openpyxl().load_workbook(path, read_only=True, data_only=True)
+        try:
+            ws = wb.active; str_ = str
+            headers = [("" if c is None else str_(c)) for c in next(ws.iter_rows(max_row=1, values_only=True), ())]
+            yield headers
+            # El cuerpo arranca en la fila 2 y se limita al ancho del encabezado.
+            for row in ws.iter_rows(min_row=2, max_col=len(headers) or None, values_only=True):
+                yield [("" if c is None else str_(c)) for c in row]
+        finally:
+            wb.close()
+    
     def _load_import(path):
         """Auto-generated docstring for `_load_import`."""
         ext = os.path.splitext(path)[1].lower()
-        rows = []; headers = []
+        if ext not in (".csv",".xlsx",".xls"):
+            messagebox.showwarning("Formato no soportado", "Selecciona un archivo .csv o .xlsx/.xls"); return
+        if ext != ".csv" and _get_openpyxl() is None:
+            messagebox.showerror("XLSX no soportado", "Para importar XLSX/XLS instala 'openpyxl' o conviértelo a CSV."); return
+        _finish_import()
         try:
-            if ext == ".csv":
-                headers, rows = _read_csv_any_encoding(path)
-            elif ext in (".xlsx",".xls"):
-                try: import openpyxl
-                except Exception:
-                    messagebox.showerror("XLSX no soportado", "Para importar XLSX/XLS instala 'openpyxl' o conviértelo a CSV."); return
-                wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
-                ws = wb.active
-                for i, row in enumerate(ws.iter_rows(values_only=True)):
-                    vals = [("" if c is None else str(c)) for c in row]
-                    if i == 0: headers = vals
-                    else: rows.append(vals)
-            else:
-                messagebox.showwarning("Formato no soportado", "Selecciona un archivo .csv o .xlsx/.xls"); return
+            rows_iter = _iter_import_rows(path, ext)
+            headers = next(rows_iter, [])
         except Exception as ex:
             messagebox.showerror("Error al leer archivo", f"No se pudo leer el archivo:\n{ex}"); return
-    
         ok, msg = _headers_ok(headers)
-        if not ok: messagebox.showwarning("Encabezados incompatibles", msg); return
+        if not ok: rows_iter.close(); messagebox.showwarning("Encabezados incompatibles", msg); return
+    
+        # Relleno/recorte con una sola concatenación + slice por fila (pad precalculado).
+        width = len(headers); pad = [""] * width
+        imp_rows.clear(); _tree_set_columns(imp_tree, headers); imp_window.render(0)
+    
+        def _next_chunk():
+            """Load the next block of rows and yield to the event loop before the following one."""
+            import_job["job"] = None
+            try: chunk = [(r + pad)[:width] for r in islice(rows_iter, IMPORT_CHUNK_SIZE)]
+            except Exception as ex:
+                _finish_import(); imp_rows.clear(); imp_window.render(0)
+                messagebox.showerror("Error al leer archivo", f"No se pudo leer el archivo:\n{ex}"); return
+            previous_len = len(imp_rows); imp_rows.extend(chunk)
+            # Solo se insertan las filas nuevas que caen en la ventana; el scroll y la selección se conservan.
+            imp_window.show_appended(previous_len)
+            if len(chunk) == IMPORT_CHUNK_SIZE:
+                gm_status.set(f"Cargando… {len(imp_rows)} filas")
+                import_job["job"] = root.after(1, _next_chunk); return
+            _finish_import()
+            # La renumeración cambia la primera columna: se redibuja la ventana actual sin perder posición ni selección.
+            top = imp_tree.yview()[0]; sel = imp_tree.selection()
+            _renumber_rows(imp_rows, headers); imp_window.render()
+            imp_tree.yview_moveto(top); imp_tree.selection_set([it for it in sel if imp_tree.exists(it)])
+            _, dyn, _ = _split_headers(headers)
+            gm_dyncols.clear(); gm_dyncols.extend(dyn)
+            _man_build_tree_headers(); _sync_dyncol_rows(); _render_dynchips()
+            gm_status.set(f"Archivo cargado. Columnas dinámicas: {', '.join(dyn) if dyn else '(ninguna)'}")
     
-        imp_tree.delete(*imp_tree.get_children()); _tree_set_columns(imp_tree, headers)
-        for r in rows:
-            if len(r) < len(headers): r = r + [""]*(len(headers)-len(r))
-            elif len(r) > len(headers): r = r[:len(headers)]
-            imp_tree.insert("", "end", values=r)
-        _renumber_cases(imp_tree)
+        import_job.update(rows=rows_iter, job=None)
+        imp_cancel_btn.pack(side=LEFT, padx=(8,0))
+        _next_chunk()
     
-        _, dyn, _ = _split_headers(headers)
-        gm_dyncols.clear(); gm_dyncols.extend(dyn)
-        _man_build_tree_headers(); _rebuild_manual_inputs(); _render_dynchips()
-        gm_status.set(f"Archivo cargado. Columnas dinámicas: {', '.join(dyn) if dyn else '(ninguna)'}")
+    edit_dialog = {}
     
     def _man_edit_selected():
         """Auto-generated docstring for `_man_edit_selected`."""
         sel = man_tree.selection()
         if not sel: messagebox.showinfo("Editar", "Selecciona una fila para editar."); return
-        item = sel[0]; values = list(man_tree.item(item, 'values'))
-        win = tk.Toplevel(root); win.title("Editar fila"); win.geometry("520x380")
-        vars_map = []
-        for i, h in enumerate(man_tree['columns']):
-            v = tk.StringVar(value=values[i]); vars_map.append((h,v))
-            fr = tb.Frame(win); fr.pack(fill=X, padx=10, pady=4)
-            tb.Label(fr, text=h, width=24).pack(side=LEFT); tb.Entry(fr, textvariable=v).pack(side=LEFT, fill=X, expand=True)
-        def _ok():
-            """Auto-generated docstring for `_ok`."""
-            new_vals = [v.get() for _,v in vars_map]; man_tree.item(item, values=new_vals); win.destroy()
-        tb.Button(win, text="Guardar", bootstyle=PRIMARY, command=_ok).pack(side=RIGHT, padx=10, pady=10)
-        tb.Button(win, text="Cancelar", bootstyle=SECONDARY, command=win.destroy).pack(side=RIGHT, pady=10)
+        item = sel[0]; values = list(man_values.get(item) or man_tree.item(item, 'values'))
+        win = edit_dialog.get("win")
+        if win is None or not win.winfo_exists():
+            # La ventana y sus campos se crean una vez y se reutilizan en cada edición.
+            win = tk.Toplevel(root); win.title("Editar fila"); win.geometry("520x380"); win.transient(root)
+            win.protocol("WM_DELETE_WINDOW", _hide_edit_dialog)
+            fields = tb.Frame(win); fields.pack(fill=X)
+            tb.Button(win, text="Guardar", bootstyle=PRIMARY, command=_man_edit_ok).pack(side=RIGHT, padx=10, pady=10)
+            tb.Button(win, text="Cancelar", bootstyle=SECONDARY, command=_hide_edit_dialog).pack(side=RIGHT, pady=10)
+            edit_dialog.update(win=win, fields=fields, rows=[])
+        rows = edit_dialog["rows"]; cols = man_tree['columns']
+        while len(rows) < len(cols):
+            fr = tb.Frame(edit_dialog["fields"]); lbl = tb.Label(fr, width=24); lbl.pack(side=LEFT)
+            v = tk.StringVar(value=""); tb.Entry(fr, textvariable=v).pack(side=LEFT, fill=X, expand=True)
+            rows.append((fr, lbl, v))
+        for i, (fr, lbl, v) in enumerate(rows):
+            if i < len(cols):
+                lbl.configure(text=cols[i]); v.set(values[i] if i < len(values) else ""); fr.pack(fill=X, padx=10, pady=4)
+            else: fr.pack_forget()
+        edit_dialog["item"] = item
+        # Modal mientras está visible para que la tabla no cambie debajo de la edición.
+        win.deiconify(); win.lift(); win.grab_set()
+    
+    def _hide_edit_dialog():
+        """Release the modal grab and hide the reusable edit dialog."""
+        win = edit_dialog.get("win")
+        if win is None or not win.winfo_exists(): return
+        win.grab_release(); win.withdraw()
+    
+    def _destroy_edit_dialog(event):
+        """Destroy the pooled edit dialog together with the view that owns it."""
+        if event.widget is not man_tree: return
+        win = edit_dialog.pop("win", None)
+        if win is not None and win.winfo_exists(): win.destroy()
+    
+    man_tree.bind("<Destroy>", _destroy_edit_dialog, add="+")
+    
+    def _man_edit_ok():
+        """Store the edited values in the selected row and hide the reusable dialog."""
+        item = edit_dialog.get("item"); count = len(man_tree['columns'])
+        new_vals = [v.get() for _, _, v in edit_dialog["rows"][:count]]
+        if item and man_tree.exists(item):
+            man_tree.item(item, values=new_vals); man_values[item] = new_vals
+        _hide_edit_dialog()
     
     def _man_delete_selected():
         """Auto-generated docstring for `_man_delete_selected`."""
         sel = man_tree.selection()
         if not sel: return
         if not messagebox.askyesno("Eliminar", f"¿Eliminar {len(sel)} fila(s)?"): return
-        for it in sel: man_tree.delete(it)
-        _renumber_cases(man_tree)
+        man_tree.delete(*sel)
+        for it in sel: man_values.pop(it, None)
+        _schedule_renumber(man_tree)
     
     def _man_clear_all():
         """Auto-generated docstring for `_man_clear_all`."""
-        if not man_tree.get_children(""): return
+        if not man_values: return
         if not messagebox.askyesno("Vaciar tabla", "¿Vaciar todas las filas capturadas?"): return
-        man_tree.delete(*man_tree.get_children()); gm_case_counter.set(1)
+        _man_clear_rows(); gm_case_counter.set(1)
     
     man_tree.bind("<Delete>", lambda e: (_man_delete_selected(), "break"))
     
@@ -445,19 +647,21 @@ def build_generacion_manual_view(
             scroll_wrap.pack(fill=X); btns.pack(fill=X, pady=(6,0))
             man_prev.pack(fill=BOTH, expand=True, pady=(6,0)); man_tv_wrap.pack(fill=BOTH, expand=True)
             man_actions.pack(fill=X, pady=(6,0))
-            _man_build_tree_headers(); _rebuild_manual_inputs(); _render_dynchips()
+            _man_build_tree_headers(); _sync_dyncol_rows(); _render_dynchips()
     
     def _load_dyncols_from_template():
         """Auto-generated docstring for `_load_dyncols_from_template`."""
         path = filedialog.askopenfilename(filetypes=[("CSV","*.csv")])
         if not path: return
         try:
-            headers, _rows = _read_csv_any_encoding(path)
+            rows_iter = _iter_csv_rows(path)
+            try: headers = next(rows_iter, [])
+            finally: rows_iter.close()
             ok, msg = _headers_ok(headers)
             if not ok: messagebox.showwarning("Plantilla incompatible", msg); return
             _, dyn, _ = _split_headers(headers)
             gm_dyncols.clear(); gm_dyncols.extend(dyn)
-            _man_build_tree_headers(); _rebuild_manual_inputs(); _render_dynchips()
+            _man_build_tree_headers(); _sync_dyncol_rows(); _render_dynchips()
             gm_status.set(f"Dinámicas cargadas: {', '.join(dyn) if dyn else '(ninguna)'}")
         except Exception as ex:
             messagebox.showerror("Error", f"No se pudo leer la plantilla:\n{ex}")
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import queue
+import threading
 from typing import Optional, Protocol
 
 import tkinter as tk
@@ -10,6 +12,10 @@ from ttkbootstrap.constants import BOTH, PRIMARY, RIGHT, SECONDARY, WARNING, W,
 
 from app.controllers.main_controller import MainController
 from app.dtos.auth_result import AuthenticationResult, AuthenticationStatus
+from app.views.autocomplete_entry import AutoCompleteEntry
+
+
+USERS_POLL_INTERVAL_MS = 50
 
 
 class MessageboxProtocol(Protocol):
@@ -55,6 +61,26 @@ class MessageboxProtocol(Protocol):
         """
 
 
+def _format_user_choice(username: str, display_name: str) -> str:
+    """Return the label shown for a user, adding the username when it differs from the name.
+
+    Args:
+        username: Login name of the user.
+        display_name: Human readable name, possibly empty.
+
+    Returns:
+        The display name alone, the username when there is no display name, or
+        ``"Display (username)"`` when both differ.
+    """
+
+    formatted_name = (display_name or "").strip()
+    if not formatted_name:
+        return username
+    if formatted_name.casefold() == username.casefold():
+        return formatted_name
+    return f"{formatted_name} ({username})"
+
+
 def build_login_view(
     root: tb.Window,
     controller: MainController,
@@ -72,8 +98,6 @@ def build_login_view(
         ``None`` if the dialog is closed or the process is cancelled.
     """
 
-    root.update_idletasks()
-
     dialog = tb.Toplevel(root)
     dialog.title("Iniciar sesión")
     dialog.resizable(False, False)
@@ -81,8 +105,8 @@ def build_login_view(
     dialog.attributes("-topmost", True)
     dialog.withdraw()
 
+    # El contenedor se empaqueta al final, cuando ya tiene todos sus hijos.
     container = tb.Frame(dialog, padding=20)
-    container.pack(fill=BOTH, expand=YES)
 
     tb.Label(container, text="Ingrese sus credenciales", font=("Segoe UI", 12, "bold")).pack(anchor=W, pady=(0, 12))
 
@@ -91,50 +115,45 @@ def build_login_view(
     cached_password = cached_credentials.get("password", "")
 
     username_var = tk.StringVar(value=cached_username)
-    password_var = tk.StringVar(value=cached_password)
     status_var = tk.StringVar(value="Cargando usuarios activos...")
 
     display_to_username: dict[str, str] = {}
     username_to_display: dict[str, str] = {}
-    username_widget_ref: dict[str, Optional[tk.Widget]] = {"widget": None}
 
     tb.Label(container, text="Usuario", font=("Segoe UI", 10, "bold")).pack(anchor=W)
 
-    username_container = tb.Frame(container)
-    username_container.pack(fill=X, pady=(0, 10))
-
-    initial_entry = tb.Entry(username_container, textvariable=username_var)
-    initial_entry.pack(fill=X)
-    username_widget_ref["widget"] = initial_entry
+    # Las sugerencias se filtran al escribir, así el costo no crece con el número de usuarios.
+    username_picker = AutoCompleteEntry(container, username_var)
+    username_picker.entry.pack(fill=X, pady=(0, 10))
 
     tb.Label(container, text="Contraseña", font=("Segoe UI", 10, "bold")).pack(anchor=W)
-    password_entry = tb.Entry(container, textvariable=password_var, show="•")
+    password_entry = tb.Entry(container, show="•")
+    password_entry.insert(0, cached_password)
     password_entry.pack(fill=X, pady=(0, 10))
 
     tb.Label(container, textvariable=status_var, bootstyle=WARNING).pack(anchor=W, pady=(0, 10))
 
-    def _set_username_widget(widget: tk.Widget) -> None:
-        """Remember the active username widget to manage focus later on.
-
-        Args:
-            widget: Entry or combobox that should receive focus later.
-        """
-
-        username_widget_ref["widget"] = widget
-
     def _focus_username_widget() -> None:
-        """Focus the current username widget if it is available."""
+        """Focus the username entry if it is available."""
+
+        if username_picker.entry.winfo_exists():
+            username_picker.entry.focus_set()
 
-        widget = username_widget_ref.get("widget")
-        if widget and widget.winfo_exists():
-            widget.focus_set()
+    applied_size: dict[str, Optional[tuple[int, int]]] = {"size": None}
 
     def _enforce_geometry() -> None:
-        """Ensure the dialog keeps a minimum size after layout updates."""
+        """Ensure the dialog keeps a minimum size after layout updates.
+
+        Nothing is reapplied while the requested size stays the same, so repeated calls
+        neither redo the geometry work nor move a dialog the user already dragged.
+        """
 
         dialog.update_idletasks()
         required_width = max(380, dialog.winfo_reqwidth())
         required_height = max(260, dialog.winfo_reqheight())
+        if applied_size["size"] == (required_width, required_height):
+            return
+        applied_size["size"] = (required_width, required_height)
         dialog.minsize(required_width, required_height)
         screen_width = dialog.winfo_screenwidth()
         screen_height = dialog.winfo_screenheight()
@@ -148,7 +167,6 @@ def build_login_view(
         """Display and focus the dialog once it has been prepared."""
 
         _enforce_geometry()
-        dialog.update()
         if not dialog.winfo_ismapped():
             dialog.deiconify()
         if not dialog_visibility["shown"]:
@@ -160,9 +178,39 @@ def build_login_view(
         dialog.lift()
         dialog.focus_force()
 
+    prefilled_username: dict[str, str] = {"value": cached_username}
+
+    def _set_user_choices(choices: list[tuple[str, str]]) -> list[str]:
+        """Refresh the username suggestions without touching the typed text.
+
+        Args:
+            choices: Collection of ``(username, display_name)`` tuples to offer.
+
+        Returns:
+            The labels offered as suggestions, in the same order as ``choices``.
+        """
+
+        current_value = username_picker.entry.get().strip()
+        current_username = display_to_username.get(current_value)
+        usernames = [username for username, _ in choices]
+        display_values = [_format_user_choice(username, display_name) for username, display_name in choices]
+        display_to_username.clear()
+        display_to_username.update(zip(display_values, usernames))
+        # Una etiqueta ya elegida sigue resolviendo a su usuario aunque la lista nueva la cambie.
+        if current_username is not None:
+            display_to_username.setdefault(current_value, current_username)
+        username_to_display.clear()
+        # Recorrer al revés conserva la primera etiqueta de cada usuario repetido.
+        username_to_display.update(zip(reversed(usernames), reversed(display_values)))
+        username_picker.set_values(display_values)
+        return display_values
+
     def apply_user_choices(choices: list[tuple[str, str]], error_message: Optional[str]) -> None:
         """Populate the username input once the user list has been resolved.
 
+        The username is only preselected while the field is empty or still holds the value
+        the dialog put there, and the focus is left where the user placed it.
+
         Args:
             choices: Collection of ``(username, display_name)`` tuples to show.
             error_message: Error text to display when the list retrieval fails.
@@ -171,52 +219,18 @@ def build_login_view(
         if not dialog.winfo_exists():
             return
 
-        display_to_username.clear()
-        username_to_display.clear()
-
-        for child in username_container.winfo_children():
-            child.destroy()
-
-        if choices:
-            display_values: list[str] = []
-            for username, display_name in choices:
-                formatted_name = (display_name or "").strip()
-                if not formatted_name:
-                    formatted_name = username
-                elif formatted_name.lower() != username.lower():
-                    formatted_name = f"{formatted_name} ({username})"
-                display_values.append(formatted_name)
-                display_to_username[formatted_name] = username
-                username_to_display.setdefault(username, formatted_name)
-
-            username_combo = tb.Combobox(
-                username_container,
-                textvariable=username_var,
-                values=display_values,
-                state="readonly",
-            )
-            username_combo.pack(fill=X)
-            _set_username_widget(username_combo)
-
-            if cached_username and cached_username in username_to_display:
-                username_var.set(username_to_display[cached_username])
-            elif display_values:
-                username_var.set(display_values[0])
-        else:
-            username_entry = tb.Entry(username_container, textvariable=username_var)
-            username_entry.pack(fill=X)
-            _set_username_widget(username_entry)
-            if cached_username:
-                username_var.set(cached_username)
+        untouched = username_picker.entry.get().strip() in ("", prefilled_username["value"])
+        display_values = _set_user_choices(choices)
+        if untouched:
+            if choices:
+                selected_value = username_to_display.get(cached_username) or display_values[0]
+            else:
+                selected_value = cached_username
+            username_var.set(selected_value)
+            prefilled_username["value"] = selected_value
 
         status_var.set(error_message or "")
         _enforce_geometry()
-        _ensure_dialog_shown()
-
-        if cached_password:
-            password_entry.focus_set()
-        else:
-            _focus_username_widget()
 
     result: dict[str, Optional[AuthenticationResult]] = {"auth": None}
 
@@ -227,9 +241,9 @@ def build_login_view(
             _event: Optional Tkinter event when invoked via keyboard binding.
         """
 
-        selected_value = username_var.get().strip()
+        selected_value = username_picker.entry.get().strip()
         username = display_to_username.get(selected_value, selected_value)
-        password = password_var.get()
+        password = password_entry.get()
         if not username or not password:
             status_var.set("Capture usuario y contraseña para continuar.")
             return
@@ -241,7 +255,7 @@ def build_login_view(
             dialog.destroy()
             return
 
-        password_var.set("")
+        password_entry.delete(0, tk.END)
         if status == AuthenticationStatus.RESET_REQUIRED:
             messagebox.showerror(
                 "Cambio de contraseña requerido",
@@ -281,17 +295,70 @@ def build_login_view(
 
     tb.Button(btn_row, text="Cancelar", command=cancel, bootstyle=SECONDARY).pack(side=RIGHT, padx=(6, 0))
     tb.Button(btn_row, text="Acceder", command=submit, bootstyle=PRIMARY).pack(side=RIGHT)
+    container.pack(fill=BOTH, expand=YES)
 
     dialog.bind("<Return>", submit)
     dialog.protocol("WM_DELETE_WINDOW", cancel)
 
-    try:
-        choices, error_message = controller.auth.list_active_users()
-    except Exception as exc:  # pragma: no cover - protege contra errores inesperados
-        choices = []
-        error_message = str(exc)
+    cached_choices = controller.auth.list_cached_users()
+
+    def reconcile_user_choices(choices: list[tuple[str, str]], error_message: Optional[str]) -> None:
+        """Apply the fresh user list keeping the text and focus of a dialog already in use.
 
-    apply_user_choices(choices, error_message)
+        Args:
+            choices: Collection of ``(username, display_name)`` tuples returned by the database.
+            error_message: Error text to display when the list retrieval fails.
+        """
+
+        if not dialog.winfo_exists():
+            return
+        if not cached_choices:
+            apply_user_choices(choices, error_message)
+            return
+        if not error_message and choices != cached_choices:
+            _set_user_choices(choices)
+        status_var.set(error_message or "")
+        _enforce_geometry()
+
+    users_queue: "queue.Queue[tuple[list[tuple[str, str]], Optional[str]]]" = queue.Queue(maxsize=1)
+
+    def load_users() -> None:
+        """Fetch the active users in the background and queue them for the dialog.
+
+        The worker never touches Tk: the main thread sits in ``wait_window`` rather than in
+        ``mainloop`` while the dialog is open, so ``after`` cannot be called from here.
+        """
+
+        try:
+            choices, error_message = controller.auth.list_active_users()
+        except Exception as exc:  # pragma: no cover - protege contra errores inesperados
+            choices = []
+            error_message = str(exc)
+        users_queue.put((choices, error_message))
+
+    def poll_users() -> None:
+        """Apply the queued user list on the Tk thread or check again shortly."""
+
+        if not dialog.winfo_exists():
+            return
+        try:
+            choices, error_message = users_queue.get_nowait()
+        except queue.Empty:
+            dialog.after(USERS_POLL_INTERVAL_MS, poll_users)
+            return
+        reconcile_user_choices(choices, error_message)
+
+    if cached_choices:
+        # La lista guardada se muestra de inmediato y la consulta solo la corrige si cambió.
+        apply_user_choices(cached_choices, None)
+    # El diálogo se muestra y enfoca una sola vez; la lista que llegue después no mueve el foco.
+    _ensure_dialog_shown()
+    if cached_password:
+        password_entry.focus_set()
+    else:
+        _focus_username_widget()
+    threading.Thread(target=load_users, daemon=True).start()
+    dialog.after(USERS_POLL_INTERVAL_MS, poll_users)
 
     dialog.grab_set()
 
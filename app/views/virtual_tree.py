@@ -0,0 +1,108 @@
+"""Windowed rendering for ``ttk.Treeview`` tables backed by Python rows."""
+
+from __future__ import annotations
+
+from typing import Callable, Sequence
+from tkinter import ttk
+
+
+DEFAULT_WINDOW_SIZE = 200
+
+
+class VirtualTreeWindow:
+    """Insert only a window of rows in a Treeview and map its scrolling to the whole model.
+
+    Rows are requested on demand through ``row_at`` and inserted with their model index as
+    iid, so the selection can be translated back with :meth:`index_of`.
+    """
+
+    def __init__(
+        self,
+        tree: ttk.Treeview,
+        scrollbar: ttk.Scrollbar,
+        row_count: Callable[[], int],
+        row_at: Callable[[int], Sequence[object]],
+        window_size: int = DEFAULT_WINDOW_SIZE,
+    ) -> None:
+        """Wire the tree and scrollbar so scrolling goes through the window."""
+
+        self._tree = tree
+        self._scrollbar = scrollbar
+        self._row_count = row_count
+        self._row_at = row_at
+        self._window_size = window_size
+        self.first = 0
+        scrollbar.configure(command=self.scroll)
+        tree.configure(yscrollcommand=self.on_tree_scroll)
+
+    def window_length(self) -> int:
+        """Return how many rows are currently inserted in the tree."""
+
+        return max(0, min(self._window_size, self._row_count() - self.first))
+
+    def render(self, first: int | None = None) -> None:
+        """Insert the rows of the window starting at ``first`` (the current one by default)."""
+
+        total = self._row_count()
+        start = self.first if first is None else first
+        self.first = max(0, min(start, total - self._window_size))
+        scroll_command = self._tree.cget("yscrollcommand")
+        self._tree.configure(yscrollcommand="")
+        try:
+            self._tree.delete(*self._tree.get_children(""))
+            for index in range(self.first, self.first + self.window_length()):
+                self._tree.insert("", "end", iid=str(index), values=self._row_at(index))
+        finally:
+            self._tree.configure(yscrollcommand=scroll_command)
+
+    def show_appended(self, previous_count: int) -> None:
+        """Show rows appended to the model after it held ``previous_count`` rows.
+
+        Only the new rows that fall inside the current window are inserted; the rendered ones
+        are left alone, so the user's scroll position and selection survive. Rows beyond the
+        window only move the scrollbar.
+        """
+
+        end = min(self._row_count(), self.first + self._window_size)
+        for index in range(max(previous_count, self.first), end):
+            self._tree.insert("", "end", iid=str(index), values=self._row_at(index))
+        self.on_tree_scroll(*self._tree.yview())
+
+    def index_of(self, iid: str) -> int:
+        """Return the model index of a rendered item."""
+
+        return int(iid)
+
+    def on_tree_scroll(self, first: str, last: str) -> None:
+        """Translate the tree's window-relative scroll fractions to the whole model."""
+
+        total = self._row_count()
+        if not total:
+            self._scrollbar.set(first, last)
+            return
+        length = self.window_length()
+        self._scrollbar.set(
+            (self.first + float(first) * length) / total,
+            (self.first + float(last) * length) / total,
+        )
+
+    def scroll(self, *args: object) -> None:
+        """Handle scrollbar and mouse wheel commands, shifting the window at its edges."""
+
+        total = self._row_count()
+        if not total:
+            self._tree.yview(*args)
+            return
+        length = self.window_length()
+        top, bottom = (float(value) for value in self._tree.yview())
+        visible = max(1, round((bottom - top) * length))
+        current = self.first + round(top * length)
+        if args[0] == "moveto":
+            target = round(float(args[1]) * total)  # type: ignore[arg-type]
+        else:
+            step = int(args[1])  # type: ignore[call-overload]
+            target = current + (step * visible if str(args[2]).startswith("page") else step)
+        target = max(0, min(target, total - visible))
+        if not self.first <= target <= self.first + length - visible:
+            self.render(target - (self._window_size - visible) // 2)
+        self._tree.yview_moveto((target - self.first) / max(1, self.window_length()))
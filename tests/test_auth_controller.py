@@ -0,0 +1,98 @@
+"""Unit tests for the login caches kept by the authentication controller."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import List
+
+from app.controllers.auth_controller import AuthenticationController
+from app.daos.user_dao import UserRecord
+
+
+class FakeAuthService:
+    """Return a fixed list of active users and count the lookups."""
+
+    def __init__(self, records: List[UserRecord]) -> None:
+        """Store the records returned by every lookup.
+
+        Args:
+            records: Active users handed back by :meth:`list_active_users`.
+        """
+
+        self.records = records
+        self.calls = 0
+
+    def list_active_users(self) -> List[UserRecord]:
+        """Return the stored records and count the call.
+
+        Returns:
+            The records given to the constructor.
+        """
+
+        self.calls += 1
+        return self.records
+
+
+def _record(username: str, display_name: str) -> UserRecord:
+    """Build an active user record with the given names."""
+
+    return UserRecord(
+        username=username,
+        displayName=display_name,
+        email=None,
+        active=True,
+        passwordHash=None,
+        passwordSalt=None,
+        passwordAlgo=None,
+        requirePasswordReset=False,
+    )
+
+
+def test_listed_users_are_cached_for_the_next_login(tmp_path: Path) -> None:
+    """A successful listing is persisted and returned by ``list_cached_users``."""
+
+    service = FakeAuthService([_record("ana", "Ana López"), _record("beto", "")])
+    users_cache = tmp_path / "users_cache.json"
+    controller = AuthenticationController(service, tmp_path / "login.json", users_cache)  # type: ignore[arg-type]
+
+    assert controller.list_cached_users() == []
+    choices, error = controller.list_active_users()
+
+    assert error is None
+    assert choices == [("ana", "Ana López"), ("beto", "beto")]
+    reloaded = AuthenticationController(service, tmp_path / "login.json", users_cache)  # type: ignore[arg-type]
+    assert reloaded.list_cached_users() == choices
+
+
+def test_expired_users_cache_is_ignored(tmp_path: Path) -> None:
+    """Entries older than the TTL are not offered to the login dialog."""
+
+    users_cache = tmp_path / "users_cache.json"
+    users_cache.write_text(json.dumps({"ts": 0, "choices": [["ana", "Ana"]]}), encoding="utf-8")
+    controller = AuthenticationController(FakeAuthService([]), tmp_path / "login.json", users_cache)  # type: ignore[arg-type]
+
+    assert controller.list_cached_users() == []
+
+
+def test_cached_credentials_are_read_once(tmp_path: Path) -> None:
+    """The credentials file is only read on the first call of the session."""
+
+    login_cache = tmp_path / "login.json"
+    login_cache.write_text(json.dumps({"username": "ana", "password": "secreto"}), encoding="utf-8")
+    controller = AuthenticationController(FakeAuthService([]), login_cache)  # type: ignore[arg-type]
+
+    assert controller.load_cached_credentials() == {"username": "ana", "password": "secreto"}
+    login_cache.unlink()
+    assert controller.load_cached_credentials() == {"username": "ana", "password": "secreto"}
+
+
+def test_missing_credentials_file_is_not_read_again(tmp_path: Path) -> None:
+    """A first read that finds no file is remembered for the rest of the session."""
+
+    login_cache = tmp_path / "login.json"
+    controller = AuthenticationController(FakeAuthService([]), login_cache)  # type: ignore[arg-type]
+
+    assert controller.load_cached_credentials() is None
+    login_cache.write_text(json.dumps({"username": "ana", "password": "secreto"}), encoding="utf-8")
+    assert controller.load_cached_credentials() is None
@@ -68,6 +68,32 @@ def test_export_json_uses_company_and_sprint_directories(tmp_path: Path) -> None
     assert json.loads(path.read_text(encoding="utf-8"))["descripcion"] == "Contenido"
 
 
+def test_export_json_reuses_serialized_text(tmp_path: Path) -> None:
+    """Pre-serialized JSON text should be written as-is instead of re-encoding the content."""
+
+    card = _build_card(5, "Activa", "", "JSON-2")
+    output = _build_output(card.cardId, {"descripcion": "Contenido"})
+    service = CardAIExportService(base_directory=tmp_path)
+    serialized = json.dumps(output.content, ensure_ascii=False, indent=2)
+
+    path = service.export_output(card, output, CardAIExportFormat.JSON, serialized)
+
+    assert path.read_text(encoding="utf-8") == serialized
+
+
+def test_export_json_streams_indented_content(tmp_path: Path) -> None:
+    """Streamed JSON exports must match the indented serialization, keeping non-ASCII text."""
+
+    card = _build_card(6, "Activa", "", "JSON-3")
+    content = {"descripcion": "Acción", "pasos": ["Uno", {"detalle": "Dos"}], "total": 2}
+    output = _build_output(card.cardId, content)
+    service = CardAIExportService(base_directory=tmp_path)
+
+    path = service.export_output(card, output, CardAIExportFormat.JSON)
+
+    assert path.read_text(encoding="utf-8") == json.dumps(content, ensure_ascii=False, indent=2)
+
+
 def test_export_without_sprint_stores_under_company(tmp_path: Path) -> None:
     """Cards without sprint use only the company folder."""
 
@@ -82,6 +108,24 @@ def test_export_without_sprint_stores_under_company(tmp_path: Path) -> None:
     assert "## detalle" in path.read_text(encoding="utf-8")
 
 
+def test_export_markdown_renders_sections_and_lists(tmp_path: Path) -> None:
+    """Markdown exports should write one section per key and bullets for lists."""
+
+    card = _build_card(4, "Activa", "", "MD-1")
+    output = _build_output(
+        card.cardId,
+        {"titulo": "Ajuste", "criterios_aceptacion": ["Caso 1", "Caso 2"]},
+    )
+    service = CardAIExportService(base_directory=tmp_path)
+
+    path = service.export_output(card, output, CardAIExportFormat.MARKDOWN)
+
+    assert path.read_text(encoding="utf-8") == (
+        "# Documento generado\n\n## titulo\nAjuste"
+        "\n\n## criterios_aceptacion\n- Caso 1\n- Caso 2"
+    )
+
+
 def test_export_html_generates_template_file(tmp_path: Path) -> None:
     """HTML exports should render the configured template."""
 
@@ -0,0 +1,31 @@
+"""Unit tests for the suggestion ranking used by the autocomplete entry."""
+
+from __future__ import annotations
+
+from app.utils.choice_ranking import rank_choices
+
+
+def test_prefix_matches_rank_before_substring_matches() -> None:
+    """Values starting with the query come first, then values containing it."""
+
+    values = ["María Ana (mana)", "Ana López (ana)", "Bruno (bruno)", "ANAIS (anais)"]
+
+    assert rank_choices("ana", values) == ["Ana López (ana)", "ANAIS (anais)", "María Ana (mana)"]
+
+
+def test_results_are_capped_to_the_limit() -> None:
+    """Only ``limit`` suggestions are returned however many values match."""
+
+    values = [f"usuario {index}" for index in range(5000)]
+
+    assert rank_choices("usuario", values, limit=50) == values[:50]
+    assert rank_choices("", values, limit=3) == values[:3]
+
+
+def test_typos_fall_back_to_similar_words_only() -> None:
+    """A misspelled query still finds the close name but not names sharing a single letter."""
+
+    values = ["Bruno (bruno)", "María Ruiz (maria)", "Zoe (zoe)"]
+
+    assert rank_choices("mria", values) == ["María Ruiz (maria)"]
+    assert rank_choices("xq", values) == []
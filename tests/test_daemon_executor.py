@@ -0,0 +1,103 @@
+"""Unit tests for the DaemonExecutor worker pool."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from app.utils.daemon_executor import DaemonExecutor
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _workers(prefix: str) -> List[threading.Thread]:
+    """Return the live threads started by the executor with ``prefix``."""
+
+    return [thread for thread in threading.enumerate() if thread.name.startswith(f"{prefix}_")]
+
+
+def test_submit_returns_the_result_of_the_job() -> None:
+    """The future resolves to the value returned by the callable."""
+
+    executor = DaemonExecutor(2, "test-result")
+
+    assert executor.submit(lambda: 21 * 2).result(timeout=5) == 42
+
+
+def test_exceptions_are_delivered_through_the_future() -> None:
+    """A failing job does not kill its worker and the error reaches the caller."""
+
+    executor = DaemonExecutor(1, "test-error")
+
+    def fail() -> None:
+        """Raise the error the test expects back."""
+
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        executor.submit(fail).result(timeout=5)
+    assert executor.submit(lambda: "ok").result(timeout=5) == "ok"
+
+
+def test_queued_jobs_can_be_cancelled_before_they_start() -> None:
+    """A job waiting behind a busy worker is skipped once cancelled."""
+
+    executor = DaemonExecutor(1, "test-cancel")
+    release = threading.Event()
+    ran: List[str] = []
+    blocking = executor.submit(release.wait)
+    queued = executor.submit(lambda: ran.append("queued"))
+
+    assert queued.cancel()
+    release.set()
+    blocking.result(timeout=5)
+    executor.submit(lambda: None).result(timeout=5)
+    assert queued.cancelled()
+    assert ran == []
+
+
+def test_workers_are_capped_reused_and_daemon() -> None:
+    """Never more than ``max_workers`` daemon threads run, and idle ones take new jobs."""
+
+    executor = DaemonExecutor(3, "test-cap")
+    release = threading.Event()
+    busy = [executor.submit(release.wait) for _ in range(6)]
+
+    time.sleep(0.1)
+    assert len(_workers("test-cap")) == 3
+    assert all(thread.daemon for thread in _workers("test-cap"))
+    release.set()
+    for future in busy:
+        future.result(timeout=5)
+    for _ in range(10):
+        executor.submit(lambda: None).result(timeout=5)
+    assert len(_workers("test-cap")) == 3
+
+    single = DaemonExecutor(4, "test-reuse")
+    for _ in range(5):
+        single.submit(lambda: None).result(timeout=5)
+        # The worker only marks itself idle right after resolving the future.
+        time.sleep(0.05)
+    assert len(_workers("test-reuse")) == 1
+
+
+def test_interpreter_exits_while_a_job_is_running() -> None:
+    """A running job does not keep the process alive the way ThreadPoolExecutor does."""
+
+    script = (
+        "import time\n"
+        "from app.utils.daemon_executor import DaemonExecutor\n"
+        "DaemonExecutor(1, 'exit').submit(lambda: time.sleep(30))\n"
+        "time.sleep(0.1)\n"
+    )
+    started = time.monotonic()
+    subprocess.run([sys.executable, "-c", script], cwd=REPO_ROOT, check=True, timeout=20)
+
+    assert time.monotonic() - started < 10
@@ -0,0 +1,150 @@
+"""Unit tests for the VirtualTreeWindow helper."""
+
+from __future__ import annotations
+
+from typing import Dict, List, Sequence, Tuple
+
+from app.views.virtual_tree import VirtualTreeWindow
+
+
+class _FakeTree:
+    """Minimal Treeview stand-in that shows ``visible`` rows at a time."""
+
+    def __init__(self, visible: int) -> None:
+        """Start with no rows and the view at the top."""
+
+        self.items: Dict[str, Sequence[object]] = {}
+        self.order: List[str] = []
+        self.options: Dict[str, object] = {}
+        self.visible = visible
+        self.top = 0.0
+
+    def configure(self, **options: object) -> None:
+        """Store the configured options."""
+
+        self.options.update(options)
+
+    def cget(self, option: str) -> object:
+        """Return a previously configured option."""
+
+        return self.options.get(option, "")
+
+    def get_children(self, _item: str = "") -> Tuple[str, ...]:
+        """Return the inserted iids in order."""
+
+        return tuple(self.order)
+
+    def delete(self, *iids: str) -> None:
+        """Remove the given items."""
+
+        for iid in iids:
+            self.items.pop(iid)
+            self.order.remove(iid)
+
+    def insert(self, _parent: str, _index: str, iid: str, values: Sequence[object]) -> str:
+        """Append an item."""
+
+        self.items[iid] = values
+        self.order.append(iid)
+        return iid
+
+    def yview(self, *_args: object) -> Tuple[float, float]:
+        """Return the visible fraction of the inserted rows."""
+
+        count = max(1, len(self.order))
+        return self.top, min(1.0, self.top + self.visible / count)
+
+    def yview_moveto(self, fraction: float) -> None:
+        """Scroll the inserted rows to ``fraction``."""
+
+        self.top = fraction
+
+
+class _FakeScrollbar:
+    """Scrollbar stand-in that records the last position."""
+
+    def __init__(self) -> None:
+        """Start without a position."""
+
+        self.options: Dict[str, object] = {}
+        self.position: Tuple[float, float] = (0.0, 0.0)
+
+    def configure(self, **options: object) -> None:
+        """Store the configured options."""
+
+        self.options.update(options)
+
+    def set(self, first: float, last: float) -> None:
+        """Record the position sent by the tree."""
+
+        self.position = (float(first), float(last))
+
+
+def _build(
+    total: int, window_size: int = 20, visible: int = 5
+) -> Tuple[VirtualTreeWindow, _FakeTree, _FakeScrollbar]:
+    """Return a window over ``total`` synthetic rows."""
+
+    rows = [[f"fila {index}"] for index in range(total)]
+    tree = _FakeTree(visible)
+    scrollbar = _FakeScrollbar()
+    window = VirtualTreeWindow(tree, scrollbar, lambda: len(rows), lambda i: rows[i], window_size)  # type: ignore[arg-type]
+    return window, tree, scrollbar
+
+
+def test_render_inserts_only_the_window() -> None:
+    """Only ``window_size`` rows should reach the tree, keyed by model index."""
+
+    window, tree, _scrollbar = _build(1000)
+
+    window.render(0)
+
+    assert tree.order == [str(index) for index in range(20)]
+    assert window.index_of("7") == 7
+
+
+def test_scroll_past_the_window_moves_it() -> None:
+    """Jumping to the end should render the last rows of the model."""
+
+    window, tree, _scrollbar = _build(1000)
+    window.render(0)
+
+    window.scroll("moveto", "1.0")
+
+    assert tree.order[-1] == "999"
+    assert len(tree.order) == 20
+
+
+def test_tree_scroll_maps_to_whole_model() -> None:
+    """The scrollbar receives fractions relative to the full row count."""
+
+    window, _tree, scrollbar = _build(100)
+    window.render(50)
+
+    window.on_tree_scroll("0.0", "0.25")
+
+    assert scrollbar.position == (0.5, 0.55)
+
+
+def test_appended_rows_keep_the_rendered_window() -> None:
+    """Rows appended during an import fill the window without re-rendering it."""
+
+    rows = [[f"fila {index}"] for index in range(15)]
+    tree = _FakeTree(5)
+    scrollbar = _FakeScrollbar()
+    window = VirtualTreeWindow(tree, scrollbar, lambda: len(rows), lambda i: rows[i], 20)  # type: ignore[arg-type]
+    window.render(0)
+    tree.yview_moveto(0.2)
+
+    rows.extend([f"fila {index}"] for index in range(15, 100))
+    window.show_appended(15)
+
+    assert tree.order == [str(index) for index in range(20)]
+    assert tree.top == 0.2
+    assert scrollbar.position == (0.04, 0.09)
+
+    rows.extend([f"fila {index}"] for index in range(100, 200))
+    window.show_appended(100)
+
+    assert tree.order == [str(index) for index in range(20)]
+    assert scrollbar.position == (0.02, 0.045)